@@ -1,15 +1,14 @@
-from flask import Flask, render_template, request, session, redirect, url_for, flash, jsonify
+from flask import Flask, render_template, request, session, redirect, url_for, flash, jsonify, Response, stream_with_context
 from werkzeug.utils import secure_filename
 import os
-import uuid
-from core.cv_parser import parse_cv
-from core.scrapers import scrape_jobs
+import json
+from core.cv_tasks import CV_PARSE_QUEUE
+from core.scrapers import iter_scrape_jobs
 from core.matcher import MatchScoreEngine
+from core.job_store import JOB_STORE, job_id_for
 from config import Config
 from flask_session import Session
 
-JOBS_CACHE = {}
-
 def create_app():
     app = Flask(__name__, template_folder='templates', static_folder='static')
     app.config.from_object(Config)
@@ -20,6 +19,8 @@ def create_app():
 
     @app.before_request
     def reload_users():
+        if request.endpoint == 'static':
+            return
         from core.auth import reload_users_db
         reload_users_db()
 
@@ -27,12 +28,35 @@ def create_app():
     def landing():
         return render_template('landing.html')
 
+    def _prepare_jobs(jobs, cv_data):
+        from core.alerts import ALERTS
+        job_ids = JOB_STORE.put_many(jobs)
+        ALERTS.notify()
+        for job, job_id in zip(jobs, job_ids):
+            job['id'] = job_id
+        return _attach_scores(jobs, cv_data)
+
+    def _attach_scores(jobs, cv_data):
+        if cv_data and cv_data.get('parsed'):
+            stats = JOB_STORE.term_stats()
+            cv_key = f"{matcher.cv_key(cv_data)}-t{stats.version}"
+            scores = JOB_STORE.get_scores(cv_key, [job['id'] for job in jobs])
+            unscored = [job for job in jobs if job['id'] not in scores]
+            vectors = JOB_STORE.get_vectors([job['id'] for job in unscored])
+            text_scores = matcher.text_scores(cv_data, [vectors.get(job['id']) for job in unscored], stats)
+            computed = dict(zip((job['id'] for job in unscored), matcher.score_jobs(unscored, cv_data, text_scores)))
+            for job in jobs:
+                job['match_score'], job['missing_skills'] = scores.get(job['id']) or computed[job['id']]
+            if computed:
+                JOB_STORE.put_scores(cv_key, computed)
+        elif cv_data:
+            for job, (score, missing) in zip(jobs, matcher.score_jobs(jobs, cv_data)):
+                job['match_score'], job['missing_skills'] = score, missing
+        return jobs
+
     @app.route('/search', methods=['GET', 'POST'])
     def search():
-        jobs = []
-        search_performed = False
-        role = ""
-        place = ""
+        stream_query = None
 
         if request.method == 'POST':
             role = request.form.get('role', '').strip()
@@ -40,44 +64,46 @@ def create_app():
 
             if role:
                 flash(f"Searching for '{role}'...", "info")
+                stream_query = {'role': role, 'place': place}
+
+        return render_template('results.html', jobs=[], search_performed=bool(stream_query), stream_query=stream_query)
+
+    @app.route('/search/stream')
+    def search_stream():
+        role = request.args.get('role', '').strip()
+        place = request.args.get('place', '').strip()
+        cv_data = session.get('cv_parsed')
+
+        def generate():
+            if role:
                 try:
-                    scraped_jobs = scrape_jobs(role, place)
-                    search_performed = True
-                    
-                    jobs = []
-                    for job in scraped_jobs:
-                        job_id = str(uuid.uuid4())
-                        job['id'] = job_id
-                        JOBS_CACHE[job_id] = job
-                        jobs.append(job)
-
-                    if not jobs:
-                        flash("No jobs found. Try 'python developer' or 'data analyst'.", "warning")
+                    for source, batch, replaced in iter_scrape_jobs(role, place):
+                        jobs = _prepare_jobs(batch, cv_data)
+                        html = "".join(render_template('_job_card.html', job=job) for job in jobs)
+                        payload = json.dumps({'source': source, 'count': len(jobs), 'html': html,
+                                              'replaces': [job_id_for(job) for job in replaced]})
+                        yield f"event: jobs\ndata: {payload}\n\n"
                 except Exception as e:
-                    flash("Scraping error. Try again.", "error")
                     print(f"Error: {e}")
+            yield "event: done\ndata: {}\n\n"
 
-        if session.get('cv_parsed') and jobs:
-            cv_data = session['cv_parsed']
-            for job in jobs:
-                score, missing = matcher.calculate_score(job, cv_data)
-                job['match_score'] = score
-                job['missing_skills'] = missing
-
-        return render_template('results.html', jobs=jobs, search_performed=search_performed)
+        return Response(
+            stream_with_context(generate()),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
 
     @app.route('/job/<job_id>')
     def job_detail(job_id):
-        job = JOBS_CACHE.get(job_id)
+        job = JOB_STORE.get(job_id)
         if not job:
             flash('Job not found or expired', 'error')
             return redirect('/search')
+        _attach_scores([job], session.get('cv_parsed'))
         return render_template('job_detail.html', job=job)
 
     @app.route('/upload', methods=['GET', 'POST'])
     def upload_cv():
-        from core.auth import is_logged_in, get_current_user, USERS_DB, _save_users
-        
         if request.method == 'POST':
             if 'cv_file' not in request.files:
                 flash('No file selected', 'error')
@@ -93,35 +119,72 @@ def create_app():
                 return redirect(request.url)
 
             filename = secure_filename(file.filename)
-            filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-            file.save(filepath)
 
             try:
-                cv_data = parse_cv(filepath)
-                session['cv_parsed'] = cv_data
-                session['cv_filename'] = filename
-                
-                if is_logged_in():
-                    user = get_current_user()
-                    if user:
-                        user.cv_data = cv_data
-                        user.cv_filename = filename
-                        _save_users(USERS_DB)
-                
-                flash(f"CV '{filename}' analyzed successfully!", 'success')
+                task_id = CV_PARSE_QUEUE.submit(file.read(), filename)
             except Exception as e:
                 flash('Error reading CV', 'error')
                 print(f"CV Parse Error: {e}")
+                return redirect(request.url)
 
-            return redirect('/search')
+            if not task_id:
+                flash('We are analyzing a lot of CVs right now. Please try again in a moment.', 'warning')
+                return redirect(request.url)
+
+            session['cv_task'] = task_id
+            return redirect(url_for('upload_status_page', task_id=task_id))
 
         return render_template('upload.html')
 
+    @app.route('/upload/<task_id>')
+    def upload_status_page(task_id):
+        if session.get('cv_task') != task_id:
+            return redirect('/upload')
+        return render_template('upload_status.html', task_id=task_id)
+
+    @app.route('/upload/<task_id>/status')
+    def upload_status(task_id):
+        from core.auth import is_logged_in, get_current_user, USERS_DB, _save_users
+
+        status = CV_PARSE_QUEUE.status(task_id)
+        if not status or session.get('cv_task') != task_id:
+            return jsonify({'status': 'unknown'}), 404
+
+        if status['status'] == 'done':
+            cv_data = status['result']
+            filename = status['filename']
+            session['cv_parsed'] = cv_data
+            session['cv_filename'] = filename
+            session.pop('cv_task', None)
+
+            if is_logged_in():
+                user = get_current_user()
+                if user:
+                    user.cv_data = cv_data
+                    user.cv_filename = filename
+                    _save_users(USERS_DB)
+                    from core.candidates import CANDIDATE_INDEX
+                    from core.alerts import ALERTS
+                    CANDIDATE_INDEX.update(user.id, cv_data)
+                    ALERTS.update_cv(user.id, cv_data)
+
+            flash(f"CV '{filename}' analyzed successfully!", 'success')
+            return jsonify({'status': 'done', 'redirect': '/search'})
+
+        if status['status'] == 'error':
+            session.pop('cv_task', None)
+            print(f"CV Parse Error: {status.get('error')}")
+            flash('Error reading CV', 'error')
+            return jsonify({'status': 'error', 'redirect': '/upload'})
+
+        return jsonify({'status': status['status']})
+
     @app.route('/save-job/<job_id>')
     def save_job(job_id):
         from core.user import User
         user = User()
         action = user.toggle_saved_job(job_id)
+        JOB_STORE.set_saved(job_id, action == "added")
         flash(f"Job {action} to saved list.", "success")
         return redirect(request.referrer or '/search')
 
@@ -130,9 +193,121 @@ def create_app():
         from core.user import User
         user = User()
         saved_ids = user.data['saved_jobs']
-        saved_jobs_list = [JOBS_CACHE[jid] for jid in saved_ids if jid in JOBS_CACHE]
+        saved_jobs_list = _attach_scores(JOB_STORE.get_many(saved_ids), session.get('cv_parsed'))
         return render_template('results.html', jobs=saved_jobs_list, search_performed=True, title="Saved Jobs")
 
+    @app.route('/recommendations')
+    def recommendations():
+        from core.recommender import RECOMMENDER
+        cv_data = session.get('cv_parsed')
+        if not cv_data or not cv_data.get('parsed'):
+            flash('Upload your CV to get recommendations', 'info')
+            return redirect('/upload')
+
+        jobs = RECOMMENDER.recommend(cv_data)
+        return render_template('results.html', jobs=jobs, search_performed=True, title="Recommended Jobs")
+
+    @app.route('/alerts')
+    def alerts():
+        from core.auth import is_logged_in, get_current_user
+        from core.alerts import ALERTS
+
+        if not is_logged_in():
+            flash('Please sign in to see your job alerts', 'warning')
+            return redirect('/signin')
+
+        user = get_current_user()
+        if not user:
+            return redirect('/signin')
+
+        jobs = ALERTS.inbox(user.id)
+        subscriptions = ALERTS.subscriptions(user.id)
+        if not subscriptions:
+            flash('No job alerts yet. Run a search and subscribe to it.', 'info')
+        return render_template('results.html', jobs=jobs, search_performed=True, title="Job Alerts",
+                               subscriptions=subscriptions, unseen_alerts=ALERTS.unseen_count(user.id))
+
+    @app.route('/alerts/seen', methods=['POST'])
+    def mark_alerts_seen():
+        from core.auth import is_logged_in, get_current_user
+        from core.alerts import ALERTS
+
+        user = get_current_user() if is_logged_in() else None
+        if not user:
+            return redirect('/signin')
+        ALERTS.mark_seen(user.id)
+        return redirect('/alerts')
+
+    @app.route('/alerts/subscribe', methods=['POST'])
+    def subscribe_alert():
+        from core.auth import is_logged_in, get_current_user
+        from core.alerts import ALERTS
+
+        user = get_current_user() if is_logged_in() else None
+        if not user:
+            flash('Please sign in to create job alerts', 'warning')
+            return redirect('/signin')
+
+        role = request.form.get('role', '').strip()
+        place = request.form.get('place', '').strip()
+        cv_data = user.cv_data or session.get('cv_parsed')
+        if not role or not cv_data or not cv_data.get('parsed'):
+            flash('Upload your CV and search for a role before subscribing', 'error')
+            return redirect(request.referrer or '/search')
+
+        ALERTS.subscribe(user.id, role, place, cv_data)
+        flash(f"You'll be alerted about new '{role}' jobs.", 'success')
+        return redirect(request.referrer or '/alerts')
+
+    @app.route('/alerts/unsubscribe/<int:subscription_id>', methods=['POST'])
+    def unsubscribe_alert(subscription_id):
+        from core.auth import get_current_user
+        from core.alerts import ALERTS
+
+        user = get_current_user()
+        if user:
+            ALERTS.unsubscribe(user.id, subscription_id)
+            flash('Alert removed', 'info')
+        return redirect('/alerts')
+
+    @app.route('/api/match-candidates', methods=['POST'])
+    def match_candidates():
+        from core.auth import is_logged_in, get_current_user, is_recruiter, USERS_DB, USERS_FILE
+        from core.candidates import CANDIDATE_INDEX, job_from_wuzzuf_row
+
+        if not is_logged_in():
+            return jsonify({'error': 'Not authenticated'}), 401
+        if not is_recruiter(get_current_user()):
+            return jsonify({'error': 'Recruiter access required'}), 403
+
+        data = request.get_json(silent=True) or {}
+        try:
+            limit = int(data.get('limit', 10))
+        except (TypeError, ValueError):
+            return jsonify({'error': 'limit must be an integer'}), 400
+        limit = max(1, min(limit, Config.CANDIDATE_LIMIT_MAX))
+
+        if data.get('job_id'):
+            job = JOB_STORE.get(data['job_id'])
+        elif data.get('wuzzuf_row'):
+            job = job_from_wuzzuf_row(data['wuzzuf_row'])
+        else:
+            job = data.get('job')
+        if not job or not job.get('title'):
+            return jsonify({'error': 'Job not found'}), 404
+
+        CANDIDATE_INDEX.sync(USERS_DB, USERS_FILE)
+        candidates = []
+        for user_id, score, missing in CANDIDATE_INDEX.rank(job, limit, JOB_STORE.term_stats()):
+            user = USERS_DB.get(user_id)
+            candidates.append({
+                'user_id': user_id,
+                'username': user.username if user else None,
+                'match_score': score,
+                'missing_skills': missing
+            })
+        return jsonify({'job': job.get('title'), 'candidates': candidates})
+
     @app.route('/build-cv')
     def build_cv():
         return render_template('build_cv.html')
@@ -211,8 +386,9 @@ def create_app():
         if not user:
             flash('User session expired. Please sign in again.', 'warning')
             return redirect('/signin')
-            
-        return render_template('profile.html', user=user)
+
+        from core.alerts import ALERTS
+        return render_template('profile.html', user=user, unseen_alerts=ALERTS.unseen_count(user.id))
 
     @app.route('/chat', methods=['GET'])
     def chat_page():
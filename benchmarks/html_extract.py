@@ -0,0 +1,109 @@
+import argparse
+import json
+import random
+import time
+from bs4 import BeautifulSoup
+from core import html_extract
+from core.html_extract import extract_description, html_to_text_bulk
+
+WORDS = (
+    "python django sql aws docker kubernetes team build reliable scalable services data "
+    "pipelines customers product engineering remote senior experience design review"
+).split()
+
+
+def _sentence(rng, n=12):
+    return " ".join(rng.choice(WORDS) for _ in range(n)).capitalize() + "."
+
+
+def make_linkedin_page(rng, nav_items=3000, paragraphs=40):
+    nav = "".join(
+        f'<li class="nav-item"><a href="/jobs/{i}"><span>{_sentence(rng, 4)}</span></a></li>'
+        for i in range(nav_items)
+    )
+    desc = "".join(f"<p>{_sentence(rng)} <strong>{rng.choice(WORDS)}</strong></p>" for _ in range(paragraphs))
+    return (
+        "<html><head><script>var x = 1;</script><style>.a{}</style></head><body>"
+        f"<ul class='jobs-nav'>{nav}</ul>"
+        "<section class='description'><div class='description__text'>"
+        f"<div class='show-more-less-html__markup relative overflow-hidden'>{desc}"
+        "<button>Show more</button></div></div></section>"
+        f"<footer>{nav}</footer></body></html>"
+    )
+
+
+def make_remoteok_descriptions(rng, count=300, paragraphs=12):
+    return [
+        "".join(f"<p>{_sentence(rng)} &amp; <b>{rng.choice(WORDS)}</b></p><ul><li>{_sentence(rng, 5)}</li></ul>"
+                for _ in range(paragraphs))
+        for _ in range(count)
+    ]
+
+
+def legacy_description(page_html):
+    soup = BeautifulSoup(page_html, "html.parser")
+    desc = soup.select_one("div.show-more-less-html__markup, div.jobs-description__content")
+    if not desc:
+        return ""
+    for bad in desc.select("button, script, style"):
+        bad.decompose()
+    return desc.get_text(separator=" ", strip=True)
+
+
+def legacy_bulk(fragments):
+    return [BeautifulSoup(f, "html.parser").get_text(separator=" ", strip=True) for f in fragments]
+
+
+def _time(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run(repeat=5, seed=42):
+    rng = random.Random(seed)
+    page = make_linkedin_page(rng)
+    fragments = make_remoteok_descriptions(rng)
+
+    results = {
+        "page_bytes": len(page),
+        "descriptions": len(fragments),
+        "parser": html_extract.PARSER,
+        "detail_ms": {
+            "legacy_html_parser": _time(lambda: legacy_description(page), repeat),
+            "strainer_html_parser": _time(lambda: extract_description(page, parser="html.parser"), repeat),
+        },
+        "remoteok_ms": {
+            "legacy_soup_per_description": _time(lambda: legacy_bulk(fragments), repeat),
+            "bulk_regex": _time(lambda: html_to_text_bulk(fragments), repeat),
+        },
+    }
+    if html_extract.PARSER != "html.parser":
+        results["detail_ms"][f"strainer_{html_extract.PARSER}"] = _time(lambda: extract_description(page), repeat)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare HTML extraction paths")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    print(f"LinkedIn detail page ({results['page_bytes'] / 1024:.0f} KB):")
+    for name, ms in results["detail_ms"].items():
+        print(f"  {name:<32} {ms:8.2f} ms")
+    print(f"RemoteOK descriptions ({results['descriptions']}):")
+    for name, ms in results["remoteok_ms"].items():
+        print(f"  {name:<32} {ms:8.2f} ms")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+import argparse
+import csv
+import json
+import platform
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from core.cv_parser import extract_skills_from_cv, parse_cv
+from core.matcher import MatchScoreEngine, NUMPY_AVAILABLE
+from core.skills import SKILLS_DB, extract_skills
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+WUZZUF_CSV = Path(__file__).resolve().parent.parent / "wuzzuf_ml_jobs.csv"
+FILLER = (
+    "build maintain reliable scalable services with the team and collaborate across product design "
+    "review code mentor engineers own delivery improve performance customers data driven remote"
+).split()
+SENIORITY = ["", "Junior ", "Senior ", "Lead "]
+MEMORY_SAMPLE = 5000
+
+
+def load_wuzzuf(path=WUZZUF_CSV):
+    try:
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            rows = [row for row in csv.DictReader(f) if row.get("title")]
+    except OSError:
+        return [], []
+    titles = [row["title"] for row in rows]
+    phrases = [p.strip(" ·") for row in rows for p in (row.get("description") or "").split("|") if p.strip(" ·")]
+    return titles, phrases
+
+
+class Corpus:
+    def __init__(self, seed=42):
+        self.rng = random.Random(seed)
+        self.skills = sorted({name for name in SKILLS_DB} | {a for aliases in SKILLS_DB.values() for a in aliases})
+        titles, phrases = load_wuzzuf()
+        self.titles = titles or ["Python Developer", "Data Engineer", "Machine Learning Engineer"]
+        self.phrases = phrases or FILLER
+
+    def _text(self, skills, words):
+        rng = self.rng
+        parts = [rng.choice(FILLER) for _ in range(words)]
+        for skill in skills:
+            parts.insert(rng.randrange(len(parts) + 1), skill)
+        for _ in range(words // 10):
+            parts.insert(rng.randrange(len(parts) + 1), rng.choice(self.phrases))
+        return " ".join(parts)
+
+    def job(self, words=80):
+        rng = self.rng
+        skills = rng.sample(self.skills, rng.randint(0, 10))
+        return {
+            "title": rng.choice(SENIORITY) + rng.choice(self.titles),
+            "company": f"Company {rng.randrange(5000)}",
+            "description": self._text(skills, words),
+            "skills_extracted": [s.title() for s in skills],
+        }
+
+    def cv_text(self):
+        rng = self.rng
+        skills = rng.sample(self.skills, rng.randint(5, 25))
+        jobs = []
+        year = 2024
+        for _ in range(rng.randint(1, 4)):
+            start = year - rng.randint(1, 4)
+            jobs.append(f"{rng.choice(self.titles)} {start} - {year}\n{self._text(rng.sample(skills, 3), 40)}")
+            year = start
+        return (
+            "Summary\n" + self._text([], 40) + "\n"
+            "Experience\n" + "\n".join(jobs) + "\n"
+            "Skills\n" + ", ".join(skills) + "\n"
+            "Education\nBSc Computer Science\n"
+        )
+
+    def cv_data(self):
+        text = self.cv_text()
+        return {
+            "raw_text": text,
+            "skills": [s.title() for s in self.rng.sample(self.skills, 15)],
+            "experience_years": self.rng.randint(0, 10),
+            "parsed": True,
+        }
+
+
+def write_docx_cvs(corpus, directory, count):
+    from docx import Document
+
+    paths = []
+    for i in range(count):
+        document = Document()
+        for line in corpus.cv_text().splitlines():
+            document.add_paragraph(line)
+        path = Path(directory) / f"cv_{i}.docx"
+        document.save(path)
+        paths.append(path)
+    return paths
+
+
+def _stats(latencies, total):
+    ordered = sorted(latencies)
+    return {
+        "calls": len(ordered),
+        "total_ms": total * 1000,
+        "per_second": len(ordered) / total if total else 0,
+        "p50_us": statistics.median(ordered) * 1e6,
+        "p99_us": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1e6,
+    }
+
+
+def _peak_memory_kb(fn, items):
+    tracemalloc.start()
+    for item in items:
+        fn(item)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def measure(fn, items):
+    latencies = []
+    start = time.perf_counter()
+    for item in items:
+        t = time.perf_counter()
+        fn(item)
+        latencies.append(time.perf_counter() - t)
+    total = time.perf_counter() - start
+    result = _stats(latencies, total)
+    result["peak_memory_kb"] = _peak_memory_kb(fn, items[:MEMORY_SAMPLE])
+    return result
+
+
+def measure_batch(fn, count):
+    start = time.perf_counter()
+    fn()
+    total = time.perf_counter() - start
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"calls": count, "total_ms": total * 1000, "per_second": count / total if total else 0,
+            "peak_memory_kb": peak / 1024}
+
+
+def run(sizes=(1000, 10000, 100000), cv_count=1000, docx_count=50, seed=42):
+    corpus = Corpus(seed)
+    engine = MatchScoreEngine()
+    cv_data = corpus.cv_data()
+    results = {
+        "python": platform.python_version(),
+        "numpy": NUMPY_AVAILABLE,
+        "seed": seed,
+        "sizes": {},
+    }
+
+    for size in sizes:
+        jobs = [corpus.job() for _ in range(size)]
+        stages = {
+            "calculate_score": measure(lambda job: engine.calculate_score(job, cv_data), jobs),
+            "extract_skills": measure(extract_skills, [job["description"] for job in jobs]),
+        }
+        if NUMPY_AVAILABLE:
+            matrix = engine.build_matrix(jobs)
+            engine.score_batch(matrix, cv_data)
+            stages["score_jobs_batch"] = measure_batch(lambda: engine.score_jobs(jobs, cv_data), size)
+            stages["score_batch_prebuilt"] = measure_batch(lambda: engine.score_batch(matrix, cv_data), size)
+            del matrix
+        results["sizes"][str(size)] = stages
+        del jobs
+
+    cv_texts = [corpus.cv_text() for _ in range(cv_count)]
+    results["extract_skills_from_cv"] = measure(extract_skills_from_cv, cv_texts)
+
+    if docx_count:
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = write_docx_cvs(corpus, tmp, docx_count)
+            results["parse_cv_docx"] = measure(parse_cv, paths)
+
+    if resource is not None:
+        results["max_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return results
+
+
+def _line(name, stats, baseline=None):
+    line = f"  {name:<24} {stats['per_second']:>14,.0f}/s"
+    if "p50_us" in stats:
+        line += f"   p50 {stats['p50_us']:9.1f} us   p99 {stats['p99_us']:9.1f} us"
+    line += f"   peak {stats['peak_memory_kb']:9.0f} KB"
+    if baseline and baseline.get("per_second"):
+        line += f"   ({(stats['per_second'] - baseline['per_second']) / baseline['per_second'] * 100:+.1f}% throughput)"
+    return line
+
+
+def _report(results, baseline=None):
+    baseline = baseline or {}
+    print(f"Matcher benchmark (python {results['python']}, numpy={results['numpy']})")
+    for size, stages in results["sizes"].items():
+        print(f"{int(size):,} jobs:")
+        for name, stats in stages.items():
+            print(_line(name, stats, baseline.get("sizes", {}).get(size, {}).get(name)))
+    print("CVs:")
+    for name in ("extract_skills_from_cv", "parse_cv_docx"):
+        if name in results:
+            print(_line(name, results[name], baseline.get(name)))
+    if "max_rss_mb" in results:
+        print(f"  max RSS {results['max_rss_mb']:.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark match scoring and skill extraction")
+    parser.add_argument("--sizes", default="1000,10000,100000",
+                        help="comma-separated job corpus sizes, e.g. 1000,10000,100000,1000000")
+    parser.add_argument("--cv-count", type=int, default=1000, help="synthetic CV texts for extract_skills_from_cv")
+    parser.add_argument("--docx-count", type=int, default=50, help="generated DOCX files for parse_cv (0 to skip)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="compare against a previous --output file")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    results = run(sizes, args.cv_count, args.docx_count, args.seed)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    _report(results, baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
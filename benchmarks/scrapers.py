@@ -0,0 +1,229 @@
+import argparse
+import hashlib
+import json
+import statistics
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from config import Config
+from core import scrapers
+from core.browser_pool import get_browser_pool
+from core.dedup import dedupe_jobs
+from core.remoteok import RemoteOKSnapshot
+from core.runtime import get_runtime
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class FixtureServer:
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.requests = 0
+        self.fixtures = {
+            "search": (FIXTURES / "linkedin_search.html").read_bytes(),
+            "detail": (FIXTURES / "linkedin_detail.html").read_bytes(),
+            "remoteok": (FIXTURES / "remoteok.json").read_bytes(),
+        }
+        self.etag = '"' + hashlib.sha1(self.fixtures["remoteok"]).hexdigest() + '"'
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+
+                path = self.path.split("?")[0]
+                if path.startswith("/jobs/search"):
+                    self._send(server.fixtures["search"], "text/html")
+                elif path.startswith("/jobs/view/"):
+                    self._send(server.fixtures["detail"], "text/html")
+                elif path == "/api":
+                    if self.headers.get("If-None-Match") == server.etag:
+                        self.send_response(304)
+                        self.end_headers()
+                    else:
+                        self._send(server.fixtures["remoteok"], "application/json", {"ETag": server.etag})
+                else:
+                    self.send_response(404)
+                    self.end_headers()
+
+            def _send(self, body, content_type, headers=None):
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    try:
+        result, error = fn(), None
+    except Exception as e:
+        result, error = None, f"{type(e).__name__}: {e}"
+    return time.perf_counter() - start, result, error
+
+
+def _summarize(samples):
+    return {
+        "runs": len(samples),
+        "median_ms": statistics.median(samples) * 1000,
+        "min_ms": min(samples) * 1000,
+        "max_ms": max(samples) * 1000,
+    }
+
+
+def run(role="python developer", max_jobs=20, repeat=3, latency=0.0, with_delays=False):
+    runtime = get_runtime()
+    stages = {}
+    errors = {}
+
+    def record(name, fn):
+        samples = []
+        result = None
+        for _ in range(repeat):
+            elapsed, result, error = _timed(fn)
+            if error:
+                errors[name] = error
+                break
+            samples.append(elapsed)
+        if samples:
+            stages[name] = _summarize(samples)
+        return result
+
+    if not with_delays:
+        Config.LINKEDIN_SETTLE_DELAY = 0
+        Config.LINKEDIN_SCROLL_DELAY = (0, 0)
+
+    tracemalloc.start()
+    with FixtureServer(latency) as server, tempfile.TemporaryDirectory() as tmp:
+        Config.LINKEDIN_BASE_URL = server.url
+
+        def fresh_snapshot():
+            snapshot = RemoteOKSnapshot(Path(tmp) / f"remoteok-{time.perf_counter_ns()}.json", server.url + "/api", 3600)
+            scrapers.REMOTEOK_SNAPSHOT = snapshot
+            return snapshot
+
+        def remoteok_cold():
+            fresh_snapshot()
+            return runtime.run(scrapers._scrape_remoteok_async(role, max_jobs))
+
+        remoteok_jobs = record("remoteok_cold", remoteok_cold) or []
+        record("remoteok_warm", lambda: runtime.run(scrapers._scrape_remoteok_async(role, max_jobs)))
+
+        linkedin_jobs = record(
+            "linkedin_search",
+            lambda: runtime.run(scrapers._scrape_linkedin_async(role, "", max_jobs, detail_limit=0))
+        ) or []
+
+        async def enrich():
+            jobs = [dict(job) for job in linkedin_jobs]
+            await scrapers._enrich_linkedin_jobs(get_browser_pool(), jobs)
+            return jobs
+
+        if linkedin_jobs:
+            linkedin_jobs = record("linkedin_details", lambda: runtime.run(enrich())) or linkedin_jobs
+
+        record("dedupe", lambda: dedupe_jobs(linkedin_jobs + remoteok_jobs))
+
+        def end_to_end():
+            fresh_snapshot()
+            return scrapers.scrape_jobs(role, "", max_jobs, use_cache=False)
+
+        jobs = record("end_to_end", end_to_end) or []
+
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        http_requests = server.requests
+
+    e2e = stages.get("end_to_end")
+    results = {
+        "role": role,
+        "max_jobs": max_jobs,
+        "repeat": repeat,
+        "latency_ms": latency * 1000,
+        "with_delays": with_delays,
+        "stages": stages,
+        "errors": errors,
+        "jobs": len(jobs),
+        "jobs_per_second": len(jobs) / (e2e["median_ms"] / 1000) if e2e and e2e["median_ms"] else 0,
+        "http_requests": http_requests,
+        "peak_python_memory_mb": peak / 1024 / 1024,
+    }
+    if resource is not None:
+        results["max_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return results
+
+
+def _report(results, baseline=None):
+    print(f"Scraper benchmark: '{results['role']}' (max_jobs={results['max_jobs']}, repeat={results['repeat']})")
+    for name, stats in results["stages"].items():
+        line = f"  {name:<18} {stats['median_ms']:10.1f} ms"
+        if baseline and name in baseline.get("stages", {}):
+            before = baseline["stages"][name]["median_ms"]
+            if before:
+                line += f"   ({(stats['median_ms'] - before) / before * 100:+.1f}% vs baseline)"
+        print(line)
+    for name, error in results["errors"].items():
+        print(f"  {name:<18} FAILED: {error}")
+    print(f"  jobs               {results['jobs']}")
+    print(f"  jobs/sec           {results['jobs_per_second']:.1f}")
+    print(f"  peak python heap   {results['peak_python_memory_mb']:.1f} MB")
+    if "max_rss_mb" in results:
+        print(f"  max RSS            {results['max_rss_mb']:.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the scrapers against recorded fixtures")
+    parser.add_argument("--role", default="python developer")
+    parser.add_argument("--max-jobs", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=0, help="simulated network latency per request")
+    parser.add_argument("--with-delays", action="store_true", help="keep the human-like scroll and settle delays")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="compare against a previous --output file")
+    args = parser.parse_args()
+
+    results = run(args.role, args.max_jobs, args.repeat, args.latency_ms / 1000, args.with_delays)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    _report(results, baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
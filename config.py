@@ -15,7 +15,48 @@ class Config:
     DATA_FOLDER = BASE_DIR / 'data'
 
     SCRAPE_TIMEOUT = 15
+    SEARCH_DEADLINE = 45
     MAX_JOBS_PER_SOURCE = 50
+    LINKEDIN_TIMEOUT = 40
+    LINKEDIN_MAX_CONCURRENCY = 4
+    SOURCE_FAILURE_THRESHOLD = 3
+    SOURCE_RESET_TIMEOUT = 120
+
+    REMOTEOK_API_URL = 'https://remoteok.com/api'
+    REMOTEOK_SNAPSHOT_PATH = DATA_FOLDER / 'remoteok_snapshot.json'
+    REMOTEOK_REFRESH_INTERVAL = 600
+
+    JOBS_DB_PATH = DATA_FOLDER / 'jobs.db'
+    JOB_TTL = 3600 * 24 * 7
+    JOB_LRU_SIZE = 1000
+
+    RECOMMEND_TOP_K = 20
+    RECOMMEND_REBUILD_INTERVAL = 3600
+
+    ALERT_MIN_SCORE = 60
+    ALERT_BATCH_SIZE = 1000
+
+    RECRUITER_ACCOUNTS = {a.strip().lower() for a in os.environ.get('RECRUITER_ACCOUNTS', '').split(',') if a.strip()}
+    CANDIDATE_LIMIT_MAX = 100
+
+    HTTP_POOL_SIZE = 100
+    HTTP_POOL_PER_HOST = 10
+
+    SCRAPE_CACHE_DIR = DATA_FOLDER / 'scrape_cache'
+    SCRAPE_CACHE_TTL = 60 * 15
+    SCRAPE_CACHE_STALE_TTL = 3600 * 24
+
+    BROWSER_POOL_SIZE = 2
+    BROWSER_PAGES_PER_BROWSER = 4
+    BROWSER_RECYCLE_AFTER = 50
+    BROWSER_HEALTH_INTERVAL = 60
+
+    LINKEDIN_BASE_URL = 'https://www.linkedin.com'
+    LINKEDIN_SETTLE_DELAY = 4
+    LINKEDIN_SCROLL_DELAY = (1.2, 2.5)
+    LINKEDIN_DETAIL_LIMIT = 5
+    LINKEDIN_DETAIL_CONCURRENCY = 3
+    LINKEDIN_DETAIL_TIMEOUT = 20
 
     SKILLS_WEIGHT = 0.50
     KEYWORDS_WEIGHT = 0.15
@@ -25,5 +66,14 @@ class Config:
 
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024
 
-for folder in [Config.UPLOAD_FOLDER, Config.SESSION_FILE_DIR, Config.DATA_FOLDER]:
+    CV_TASK_DIR = DATA_FOLDER / 'cv_tasks'
+    CV_PARSE_WORKERS = 2
+    CV_PARSE_MAX_PENDING = 8
+    CV_TASK_TIMEOUT = 120
+    CV_MAX_PAGES = 20
+    CV_MAX_CHARS = 100_000
+    CV_CACHE_DIR = DATA_FOLDER / 'cv_cache'
+    CV_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+for folder in [Config.UPLOAD_FOLDER, Config.SESSION_FILE_DIR, Config.DATA_FOLDER, Config.SCRAPE_CACHE_DIR, Config.CV_TASK_DIR, Config.CV_CACHE_DIR]:
     folder.mkdir(parents=True, exist_ok=True)
\ No newline at end of file
@@ -0,0 +1,211 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from config import Config
+from core.job_store import JOB_STORE
+from core.matcher import MatchScoreEngine, NUMPY_AVAILABLE
+from core.scrape_cache import normalize_query
+
+logger = logging.getLogger(__name__)
+
+
+def _matches_query(job, role, place):
+    title = (job.get('title') or '').lower()
+    location = (job.get('location') or '').lower()
+    if role and not all(word in title for word in role.split()):
+        return False
+    return not place or place in location or 'remote' in location
+
+
+class JobAlerts:
+    def __init__(self, store, engine, min_score, batch_size):
+        self.store = store
+        self.engine = engine
+        self.min_score = min_score
+        self.batch_size = batch_size
+        self._local = threading.local()
+        self._process_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+        self._init_schema()
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.store.db_path, timeout=30)
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self):
+        with self._conn() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS alert_subscriptions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user_id TEXT NOT NULL,
+                    role TEXT NOT NULL,
+                    place TEXT NOT NULL,
+                    cv_data TEXT NOT NULL,
+                    min_score INTEGER NOT NULL,
+                    last_seq INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    UNIQUE (user_id, role, place)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS alert_inbox (
+                    subscription_id INTEGER NOT NULL,
+                    user_id TEXT NOT NULL,
+                    job_id TEXT NOT NULL,
+                    score INTEGER NOT NULL,
+                    missing TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    seen INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (subscription_id, job_id)
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_inbox_user ON alert_inbox (user_id, created_at)")
+
+    def subscribe(self, user_id, role, place, cv_data, min_score=None):
+        role, place = normalize_query(role, place).split("|", 1)
+        with self._conn() as conn:
+            conn.execute("""
+                INSERT INTO alert_subscriptions (user_id, role, place, cv_data, min_score, last_seq, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(user_id, role, place) DO UPDATE SET
+                    cv_data = excluded.cv_data, min_score = excluded.min_score
+            """, (user_id, role, place, json.dumps(cv_data), min_score or self.min_score,
+                  self.store.latest_seq(), time.time()))
+
+    def unsubscribe(self, user_id, subscription_id):
+        with self._conn() as conn:
+            conn.execute("DELETE FROM alert_subscriptions WHERE id = ? AND user_id = ?", (subscription_id, user_id))
+            conn.execute("DELETE FROM alert_inbox WHERE subscription_id = ? AND user_id = ?", (subscription_id, user_id))
+
+    def update_cv(self, user_id, cv_data):
+        with self._conn() as conn:
+            conn.execute("UPDATE alert_subscriptions SET cv_data = ? WHERE user_id = ?", (json.dumps(cv_data), user_id))
+
+    def subscriptions(self, user_id):
+        rows = self._conn().execute(
+            "SELECT id, role, place, min_score FROM alert_subscriptions WHERE user_id = ? ORDER BY created_at",
+            (user_id,)
+        )
+        return [{"id": sub_id, "role": role, "place": place, "min_score": min_score}
+                for sub_id, role, place, min_score in rows]
+
+    def notify(self):
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="job-alerts", daemon=True)
+                self._worker.start()
+        self._wake.set()
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            self.process()
+
+    def process(self):
+        with self._process_lock:
+            try:
+                return self._drain()
+            except Exception as e:
+                logger.warning(f"Job alert processing failed: {e}")
+                return 0
+
+    def _drain(self):
+        delivered = 0
+        while True:
+            subs = self._conn().execute(
+                "SELECT id, user_id, role, place, cv_data, min_score, last_seq FROM alert_subscriptions"
+            ).fetchall()
+            if not subs:
+                return delivered
+
+            delta = self.store.jobs_since(min(sub[6] for sub in subs), self.batch_size)
+            if not delta:
+                return delivered
+            delivered += self._deliver(subs, delta)
+            if len(delta) < self.batch_size:
+                return delivered
+
+    def _deliver(self, subs, delta):
+        jobs = {}
+        for seq, job_id, job in delta:
+            jobs[job_id] = (seq, job)
+        job_ids = list(jobs)
+        seqs = [jobs[job_id][0] for job_id in job_ids]
+        records = [jobs[job_id][1] for job_id in job_ids]
+        stats = self.store.term_stats() if NUMPY_AVAILABLE else None
+        high_water = delta[-1][0]
+
+        now = time.time()
+        inbox = []
+        advanced = []
+        for sub_id, user_id, role, place, cv_data, min_score, last_seq in subs:
+            advanced.append((high_water, sub_id))
+            rows = [i for i, seq in enumerate(seqs)
+                    if seq > last_seq and _matches_query(records[i], role, place)]
+            if not rows:
+                continue
+
+            cv_data = json.loads(cv_data)
+            if NUMPY_AVAILABLE:
+                matrix = self.engine.build_matrix([records[i] for i in rows])
+                stored = self.store.get_vectors([job_ids[i] for i in rows])
+                text_scores = self.engine.text_scores(cv_data, [stored.get(job_ids[i]) for i in rows], stats)
+                scores = self.engine.score_batch(matrix, cv_data, text_scores)
+                hits = [j for j in range(len(rows)) if scores[j] >= min_score]
+                results = zip((rows[j] for j in hits), (int(scores[j]) for j in hits),
+                              self.engine.missing_batch(matrix, cv_data, hits))
+            else:
+                scored = [(i, *self.engine.calculate_score(records[i], cv_data)) for i in rows]
+                results = [(i, score, missing) for i, score, missing in scored if score >= min_score]
+
+            for i, score, missing in results:
+                inbox.append((sub_id, user_id, job_ids[i], score, json.dumps(missing), now))
+
+        with self._conn() as conn:
+            conn.executemany("""
+                INSERT OR IGNORE INTO alert_inbox (subscription_id, user_id, job_id, score, missing, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, inbox)
+            conn.executemany(
+                "UPDATE alert_subscriptions SET last_seq = MAX(last_seq, ?) WHERE id = ?", advanced
+            )
+        if inbox:
+            logger.info(f"Delivered {len(inbox)} job alerts from {len(delta)} new jobs")
+        return len(inbox)
+
+    def inbox(self, user_id, limit=50):
+        rows = self._conn().execute("""
+            SELECT job_id, score, missing, seen FROM alert_inbox
+            WHERE user_id = ? ORDER BY created_at DESC, score DESC LIMIT ?
+        """, (user_id, limit)).fetchall()
+
+        jobs = []
+        for job_id, score, missing, seen in rows:
+            job = self.store.get(job_id)
+            if job is None:
+                continue
+            job['match_score'], job['missing_skills'] = score, json.loads(missing)
+            job['alert_seen'] = bool(seen)
+            jobs.append(job)
+        return jobs
+
+    def mark_seen(self, user_id):
+        with self._conn() as conn:
+            conn.execute("UPDATE alert_inbox SET seen = 1 WHERE user_id = ? AND seen = 0", (user_id,))
+
+    def unseen_count(self, user_id):
+        return self._conn().execute(
+            "SELECT COUNT(*) FROM alert_inbox WHERE user_id = ? AND seen = 0", (user_id,)
+        ).fetchone()[0]
+
+
+ALERTS = JobAlerts(JOB_STORE, MatchScoreEngine(), Config.ALERT_MIN_SCORE, Config.ALERT_BATCH_SIZE)
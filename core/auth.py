@@ -3,6 +3,8 @@ from flask import session
 import uuid
 import json
 import os
+import tempfile
+from config import Config
 
 USERS_FILE = os.path.join(os.path.dirname(__file__), '..', 'users_db.json')
 
@@ -48,6 +50,7 @@ def _load_users():
     return {}
 
 def _save_users(users_db):
+    global _USERS_STAMP
     try:
         data = {}
         for user_id, user in users_db.items():
@@ -59,17 +62,40 @@ def _save_users(users_db):
                 'cv_data': user.cv_data,
                 'cv_filename': user.cv_filename
             }
-        with open(USERS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(USERS_FILE), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            if os.path.exists(USERS_FILE):
+                os.chmod(tmp_path, os.stat(USERS_FILE).st_mode & 0o777)
+            os.replace(tmp_path, USERS_FILE)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+        if users_db is USERS_DB:
+            _USERS_STAMP = _users_stamp()
         print(f"[SUCCESS] Users saved to {USERS_FILE}")
     except Exception as e:
         print(f"[ERROR] Error saving users: {e}")
 
+def _users_stamp():
+    try:
+        stat = os.stat(USERS_FILE)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+_USERS_STAMP = _users_stamp()
 USERS_DB = _load_users()
 
-def reload_users_db():
-    global USERS_DB
+def reload_users_db(force=False):
+    global USERS_DB, _USERS_STAMP
+    stamp = _users_stamp()
+    if stamp == _USERS_STAMP and not force:
+        return False
     USERS_DB = _load_users()
+    _USERS_STAMP = stamp
+    return True
 
 def register_user(username, email, password):
     global USERS_DB
@@ -85,9 +111,7 @@ def register_user(username, email, password):
     return user, None
 
 def login_user(username_or_email, password):
-    global USERS_DB
-    
-    USERS_DB = _load_users()
+    reload_users_db()
     
     for user in USERS_DB.values():
         if (user.username == username_or_email or user.email == username_or_email):
@@ -97,14 +121,18 @@ def login_user(username_or_email, password):
     return None, "Invalid credentials"
 
 def get_user_by_id(user_id):
-    global USERS_DB
-    
     user = USERS_DB.get(user_id)
     if user:
         return user
     
-    USERS_DB = _load_users()
-    return USERS_DB.get(user_id)
+    if reload_users_db():
+        return USERS_DB.get(user_id)
+    return None
+
+def is_recruiter(user):
+    if not user:
+        return False
+    return user.username.lower() in Config.RECRUITER_ACCOUNTS or user.email.lower() in Config.RECRUITER_ACCOUNTS
 
 def is_logged_in():
     return 'user_id' in session
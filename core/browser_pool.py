@@ -0,0 +1,154 @@
+import asyncio
+import logging
+import weakref
+from contextlib import asynccontextmanager
+from playwright.async_api import async_playwright
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+STEALTH_SCRIPT = "Object.defineProperty(navigator, 'webdriver', {get: () => false})"
+
+
+class _PooledBrowser:
+    def __init__(self, browser, context):
+        self.browser = browser
+        self.context = context
+        self.in_use = 0
+        self.pages_served = 0
+        self.retiring = False
+
+    def is_healthy(self):
+        return not self.retiring and self.browser.is_connected()
+
+
+class BrowserPool:
+    def __init__(self, max_browsers=None, pages_per_browser=None, recycle_after=None, headless=True):
+        self.max_browsers = max_browsers or Config.BROWSER_POOL_SIZE
+        self.pages_per_browser = pages_per_browser or Config.BROWSER_PAGES_PER_BROWSER
+        self.recycle_after = recycle_after or Config.BROWSER_RECYCLE_AFTER
+        self.headless = headless
+        self._playwright = None
+        self._browsers = []
+        self._lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(self.max_browsers * self.pages_per_browser)
+        self._closed = False
+
+    async def _launch(self):
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        browser = await self._playwright.chromium.launch(headless=self.headless)
+        context = await browser.new_context()
+        await context.add_init_script(STEALTH_SCRIPT)
+        entry = _PooledBrowser(browser, context)
+        browser.on("disconnected", lambda _: self._mark_retiring(entry))
+        self._browsers.append(entry)
+        logger.info(f"Browser pool: launched browser ({len(self._browsers)}/{self.max_browsers})")
+        return entry
+
+    def _mark_retiring(self, entry):
+        entry.retiring = True
+
+    async def _checkout(self):
+        async with self._lock:
+            if self._closed:
+                raise RuntimeError("Browser pool is closed")
+            await self._reap()
+            healthy = [b for b in self._browsers if b.is_healthy() and b.in_use < self.pages_per_browser]
+            if healthy:
+                entry = min(healthy, key=lambda b: b.in_use)
+            elif sum(1 for b in self._browsers if not b.retiring) < self.max_browsers:
+                entry = await self._launch()
+            else:
+                raise RuntimeError("Browser pool exhausted")
+            entry.in_use += 1
+            return entry
+
+    async def _checkin(self, entry, crashed=False):
+        async with self._lock:
+            entry.in_use -= 1
+            entry.pages_served += 1
+            if crashed or entry.pages_served >= self.recycle_after:
+                entry.retiring = True
+            await self._reap()
+
+    async def _reap(self):
+        for entry in list(self._browsers):
+            if entry.in_use == 0 and (entry.retiring or not entry.browser.is_connected()):
+                self._browsers.remove(entry)
+                await self._close_browser(entry)
+
+    async def _close_browser(self, entry):
+        try:
+            await entry.context.close()
+            await entry.browser.close()
+        except Exception as e:
+            logger.debug(f"Browser close failed: {e}")
+
+    @asynccontextmanager
+    async def page(self):
+        async with self._slots:
+            entry = await self._checkout()
+            crashed = False
+            page = None
+            try:
+                page = await entry.context.new_page()
+                page.on("crash", lambda _: self._mark_retiring(entry))
+                yield page
+            except Exception:
+                crashed = not entry.browser.is_connected()
+                raise
+            finally:
+                if page is not None:
+                    try:
+                        await page.close()
+                    except Exception:
+                        crashed = True
+                await self._checkin(entry, crashed)
+
+    async def health_check(self):
+        async with self._lock:
+            before = len(self._browsers)
+            await self._reap()
+            return {
+                "browsers": len(self._browsers),
+                "reaped": before - len(self._browsers),
+                "healthy": sum(1 for b in self._browsers if b.is_healthy()),
+                "pages_in_use": sum(b.in_use for b in self._browsers),
+                "pages_served": sum(b.pages_served for b in self._browsers),
+            }
+
+    async def close(self):
+        async with self._lock:
+            self._closed = True
+            for entry in self._browsers:
+                await self._close_browser(entry)
+            self._browsers = []
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+
+_POOLS = weakref.WeakKeyDictionary()
+
+
+def get_browser_pool():
+    loop = asyncio.get_running_loop()
+    pool = _POOLS.get(loop)
+    if pool is None or pool._closed:
+        pool = BrowserPool()
+        _POOLS[loop] = pool
+    return pool
+
+
+async def check_browser_pool():
+    pool = _POOLS.get(asyncio.get_running_loop())
+    if pool is None or pool._closed:
+        return None
+    return await pool.health_check()
+
+
+async def close_browser_pool():
+    pool = _POOLS.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.close()
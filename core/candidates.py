@@ -0,0 +1,125 @@
+import heapq
+import logging
+import math
+import os
+import threading
+from core.matcher import MatchScoreEngine, NUMPY_AVAILABLE
+from core.skills import extract_skills
+from core.text_similarity import job_text, similarity_batch, vectorize
+
+logger = logging.getLogger(__name__)
+
+
+def job_from_wuzzuf_row(row):
+    description = row.get('description') or ''
+    title = row.get('title') or ''
+    return {
+        "title": title,
+        "company": row.get('company') or 'N/A',
+        "location": row.get('location'),
+        "url": row.get('url') if row.get('url') not in (None, 'N/A') else None,
+        "source": "Wuzzuf",
+        "description": description,
+        "skills_extracted": extract_skills(f"{title} {description}"),
+    }
+
+
+class CandidateIndex:
+    def __init__(self, engine):
+        self.engine = engine
+        self.postings = {}
+        self.user_skills = {}
+        self.user_years = {}
+        self.user_cvs = {}
+        self.user_vectors = {}
+        self.users_mtime = None
+        self._lock = threading.RLock()
+
+    def update(self, user_id, cv_data):
+        with self._lock:
+            self.remove(user_id)
+            if not cv_data or not cv_data.get('parsed'):
+                return
+
+            skills = {s.lower() for s in cv_data.get('skills', [])}
+            for skill in skills:
+                self.postings.setdefault(skill, set()).add(user_id)
+            self.user_skills[user_id] = skills
+            self.user_years[user_id] = cv_data.get('experience_years', 0)
+            self.user_cvs[user_id] = cv_data
+            self.user_vectors[user_id] = self.engine.cv_vector(cv_data)
+
+    def remove(self, user_id):
+        with self._lock:
+            for skill in self.user_skills.pop(user_id, ()):
+                users = self.postings.get(skill)
+                if users:
+                    users.discard(user_id)
+                    if not users:
+                        del self.postings[skill]
+            self.user_years.pop(user_id, None)
+            self.user_cvs.pop(user_id, None)
+            self.user_vectors.pop(user_id, None)
+
+    def sync(self, users_db, users_file):
+        try:
+            mtime = os.stat(users_file).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        with self._lock:
+            if mtime is not None and mtime == self.users_mtime:
+                return
+            changed = 0
+            for user_id, user in users_db.items():
+                cv_data = user.cv_data if user.cv_data and user.cv_data.get('parsed') else None
+                previous = self.user_cvs.get(user_id)
+                if previous == cv_data:
+                    if previous is not None:
+                        self.user_cvs[user_id] = cv_data
+                    continue
+                self.update(user_id, cv_data)
+                changed += 1
+            for user_id in set(self.user_skills) - set(users_db):
+                self.remove(user_id)
+                changed += 1
+            self.users_mtime = mtime
+            if changed:
+                logger.info(f"Candidate index synced: {changed} users updated")
+
+    def rank(self, job, k=10, stats=None):
+        job_skills = self.engine._job_skills(job)
+        weights = {s: 3 if s in self.engine.critical_skills else 1 for s in job_skills}
+        total_weight = sum(weights.values())
+        if not total_weight:
+            return []
+        senior = "senior" in (job.get('title') or '').lower()
+
+        with self._lock:
+            matched = {}
+            for skill, weight in weights.items():
+                for user_id in self.postings.get(skill, ()):
+                    matched[user_id] = matched.get(user_id, 0) + weight
+
+            user_ids = list(matched)
+            keywords = [None] * len(user_ids)
+            job_vector = vectorize(job_text(job)) if NUMPY_AVAILABLE and stats is not None else None
+            if job_vector is not None:
+                similarity = similarity_batch(job_vector, [self.user_vectors.get(u) for u in user_ids], stats)
+                keywords = [None if math.isnan(s) else s for s in similarity]
+
+            scored = []
+            for user_id, keywords_score in zip(user_ids, keywords):
+                skills_score = (matched[user_id] / total_weight) * 100
+                experience_score = 40 if senior and self.user_years[user_id] < 3 else 100
+                scored.append((self.engine._combine(skills_score, experience_score, keywords_score), user_id))
+
+            results = []
+            for score, user_id in heapq.nlargest(k, scored):
+                user_skills = self.user_skills[user_id]
+                missing = [s.title() for s in job_skills - user_skills if s in self.engine.critical_skills]
+                results.append((user_id, min(int(score), 98), missing[:6]))
+            return results
+
+
+CANDIDATE_INDEX = CandidateIndex(MatchScoreEngine())
@@ -0,0 +1,133 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import zlib
+from pathlib import Path
+from config import Config
+from core.cv_parser import PARSER_VERSION, parse_cv
+from core.skills import TAXONOMY_VERSION
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(source, chunk_size=1 << 20):
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(source).hexdigest()
+    digest = hashlib.sha256()
+    with open(source, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ParseCache:
+    def __init__(self, cache_dir, max_bytes):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.version = f"p{PARSER_VERSION}-t{TAXONOMY_VERSION}"
+        self._size = None
+        self._lock = threading.Lock()
+
+    def key(self, digest):
+        return f"{digest}-{self.version}"
+
+    def key_for(self, source):
+        return self.key(content_hash(source))
+
+    def _path(self, key):
+        return self.cache_dir / f"{key}.json.z"
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = json.loads(zlib.decompress(f.read()))
+            os.utime(path)
+            return data
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, zlib.error) as e:
+            logger.warning(f"Dropping unreadable CV cache entry {key}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def set(self, key, cv_data):
+        blob = zlib.compress(json.dumps(cv_data, separators=(",", ":")).encode("utf-8"), 6)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(blob)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            logger.warning(f"CV cache write failed: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan()[1]
+            else:
+                self._size += len(blob)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _scan(self):
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob("*.json.z"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        return entries, total
+
+    def _evict(self):
+        entries, total = self._scan()
+        entries.sort()
+        target = self.max_bytes * 0.9
+        removed = 0
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+                total -= size
+                removed += 1
+            except OSError:
+                pass
+        self._size = total
+        if removed:
+            logger.info(f"Evicted {removed} CV cache entries")
+
+    def lookup(self, source):
+        return self.get(self.key_for(source))
+
+    def parse(self, source, filename=None, digest=None):
+        start = time.perf_counter()
+        key = self.key(digest) if digest else self.key_for(source)
+        cv_data = self.get(key)
+        if cv_data is not None:
+            logger.info(f"CV cache hit in {(time.perf_counter() - start) * 1000:.1f} ms")
+            return cv_data
+
+        cv_data = parse_cv(source, filename=filename)
+        if cv_data.get('parsed'):
+            self.set(key, cv_data)
+        return cv_data
+
+
+PARSE_CACHE = ParseCache(Config.CV_CACHE_DIR, Config.CV_CACHE_MAX_BYTES)
+
+
+def parse_cv_cached(source, filename=None, digest=None):
+    return PARSE_CACHE.parse(source, filename, digest)
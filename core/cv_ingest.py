@@ -0,0 +1,185 @@
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+import zipfile
+from pathlib import Path
+from core.cv_cache import content_hash
+from core.cv_parser import parse_cv
+
+logger = logging.getLogger(__name__)
+
+CV_SUFFIXES = {".pdf", ".docx", ".doc"}
+_ARCHIVES = {}
+
+
+def iter_sources(source):
+    source = Path(source)
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            for info in archive.infolist():
+                if not info.is_dir() and Path(info.filename).suffix.lower() in CV_SUFFIXES:
+                    yield info.filename
+        return
+
+    stack = [source]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = sorted(os.scandir(directory), key=lambda e: e.name)
+        except OSError as e:
+            logger.warning(f"Skipping {directory}: {e}")
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+            elif Path(entry.name).suffix.lower() in CV_SUFFIXES:
+                yield os.path.relpath(entry.path, source)
+
+
+def _archive(path):
+    archive = _ARCHIVES.get(path)
+    if archive is None:
+        archive = _ARCHIVES[path] = zipfile.ZipFile(path)
+    return archive
+
+
+def _parse_member(archive_path, name):
+    data = _archive(archive_path).read(name)
+    return content_hash(data), parse_cv(data, filename=name)
+
+
+def parse_source(task):
+    source, name = task
+    start = time.perf_counter()
+    record = {"source": name}
+    try:
+        if os.path.isdir(source):
+            path = os.path.join(source, name)
+            record["sha256"], cv_data = content_hash(path), parse_cv(path)
+        else:
+            record["sha256"], cv_data = _parse_member(source, name)
+        record["cv_data"] = cv_data
+        record["parsed"] = bool(cv_data.get("parsed"))
+    except Exception as e:
+        record.update({"parsed": False, "error": f"{type(e).__name__}: {e}"})
+    record["parse_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    return record
+
+
+def completed_sources(output):
+    done = set()
+    try:
+        with open(output, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    done.add(json.loads(line)["source"])
+                except (ValueError, KeyError, TypeError):
+                    continue
+    except FileNotFoundError:
+        pass
+    return done
+
+
+def _open_output(output, resume):
+    if not resume:
+        return open(output, "w", encoding="utf-8")
+    with open(output, "ab+") as f:
+        end = f.tell()
+        if end:
+            f.seek(end - 1)
+            if f.read(1) != b"\n":
+                keep = 0
+                position = end
+                while position > 0 and not keep:
+                    step = min(position, 1 << 16)
+                    position -= step
+                    f.seek(position)
+                    newline = f.read(step).rfind(b"\n")
+                    if newline >= 0:
+                        keep = position + newline + 1
+                f.truncate(keep)
+    return open(output, "a", encoding="utf-8")
+
+
+def ingest(source, output, workers=None, chunksize=8, resume=True, progress_every=5.0):
+    source = os.path.abspath(source)
+    workers = workers or os.cpu_count() or 1
+    done = completed_sources(output) if resume else set()
+    tasks = ((source, name) for name in iter_sources(source) if name not in done)
+
+    stats = {"parsed": 0, "failed": 0, "skipped": len(done)}
+    start = last_report = time.perf_counter()
+    with _open_output(output, resume) as out, multiprocessing.Pool(workers) as pool:
+        for record in pool.imap_unordered(parse_source, tasks, chunksize):
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+            stats["parsed" if record["parsed"] else "failed"] += 1
+
+            now = time.perf_counter()
+            if now - last_report >= progress_every:
+                last_report = now
+                count = stats["parsed"] + stats["failed"]
+                print(f"{count:,} files, {count / (now - start):.1f} files/s", file=sys.stderr)
+
+    stats["elapsed"] = time.perf_counter() - start
+    stats["files_per_second"] = (stats["parsed"] + stats["failed"]) / stats["elapsed"] if stats["elapsed"] else 0
+    return stats
+
+
+def assign_to_users(output):
+    import core.auth as auth
+
+    auth.reload_users_db()
+    users = {}
+    for user in auth.USERS_DB.values():
+        users[user.username.lower()] = user
+        users[user.email.lower()] = user
+
+    assigned = 0
+    with open(output, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            user = users.get(Path(record["source"]).stem.lower())
+            if user is None or not record.get("parsed") or user.cv_data == record["cv_data"]:
+                continue
+            user.cv_data = record["cv_data"]
+            user.cv_filename = Path(record["source"]).name
+            assigned += 1
+
+    if assigned:
+        auth._save_users(auth.USERS_DB)
+    return assigned
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parse a directory or zip archive of CVs into JSONL")
+    parser.add_argument("source", help="directory (searched recursively) or .zip archive of PDF/DOCX files")
+    parser.add_argument("-o", "--output", default="cvs.jsonl", help="JSONL file to write, one record per CV")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--chunksize", type=int, default=8, help="files handed to a worker at a time")
+    parser.add_argument("--restart", action="store_true", help="overwrite the output instead of resuming it")
+    parser.add_argument("--assign-users", action="store_true",
+                        help="attach parsed CVs to users whose username or email matches the file name")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    if not os.path.exists(args.source):
+        parser.error(f"{args.source} does not exist")
+
+    stats = ingest(args.source, args.output, args.workers, args.chunksize, resume=not args.restart)
+    print(f"Parsed {stats['parsed']:,}, failed {stats['failed']:,}, skipped {stats['skipped']:,} already done "
+          f"in {stats['elapsed']:.1f}s ({stats['files_per_second']:.1f} files/s)")
+
+    if args.assign_users:
+        print(f"Attached CVs to {assign_to_users(args.output)} users")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,125 +1,134 @@
+import io
+import os
 import pdfplumber
 from docx import Document
 import re
 from pathlib import Path
 from rapidfuzz import fuzz
 import logging
-
-SKILLS_DB = {
-    "Python": ["python", "py", "python3", "python 3", "pandas", "numpy"],
-    "JavaScript": ["javascript", "js", "ecmascript", "node.js", "nodejs"],
-    "React": ["react", "react.js", "reactjs", "react native", "redux"],
-    "Node.js": ["node.js", "nodejs", "node"],
-    "Django": ["django", "django-rest", "drf"],
-    "Flask": ["flask"],
-    "FastAPI": ["fastapi", "fast api"],
-    "TypeScript": ["typescript", "ts", "type script"],
-    "Vue.js": ["vue", "vue.js", "vuejs", "vuetify"],
-    "Angular": ["angular", "angularjs"],
-
-    "AWS": ["aws", "amazon web services", "ec2", "s3", "lambda", "cloudformation", "ecs", "eks"],
-    "Docker": ["docker", "containers", "docker-compose"],
-    "Kubernetes": ["kubernetes", "k8s", "k8", "gke", "eks", "helm"],
-    "Terraform": ["terraform", "iac"],
-    "CI/CD": ["ci/cd", "ci cd", "jenkins", "gitlab ci", "github actions", "circleci"],
-
-    "Machine Learning": ["machine learning", "ml", "ai", "artificial intelligence"],
-    "Deep Learning": ["deep learning", "neural networks", "cnn", "rnn"],
-    "NLP": ["nlp", "natural language processing", "text mining", "bert", "gpt", "llm", "transformers", "hugging face"],
-    "Computer Vision": ["computer vision", "opencv", "yolo", "image processing"],
-    "TensorFlow": ["tensorflow", "tf", "keras"],
-    "PyTorch": ["pytorch", "torch"],
-    "Pandas": ["pandas", "pd"],
-    "NumPy": ["numpy", "np"],
-    "SQL": ["sql", "mysql", "postgresql", "postgres", "sqlite", "oracle", "mssql", "redshift"],
-
-    "Git": ["git", "github", "gitlab", "bitbucket"],
-    "Linux": ["linux", "ubuntu", "bash", "shell scripting"],
-    "Figma": ["figma", "ui/ux", "adobe xd"],
-    "Power BI": ["power bi", "powerbi"],
-    "Tableau": ["tableau"],
-    "Excel": ["excel", "vba", "pivot tables"],
-    "Agile": ["agile", "scrum", "kanban", "jira", "trello"],
-}
-
-FLATTENED_SKILLS = {}
-for standard, variants in SKILLS_DB.items():
-    for v in variants:
-        FLATTENED_SKILLS[v.lower()] = standard
-
-def extract_text_from_pdf(file_path):
-    text = ""
+from config import Config
+from core.skills import SKILLS_DB, FLATTENED_SKILLS, SKILL_MATCHER
+
+PARSER_VERSION = 2
+
+def open_source(source):
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    return source
+
+def document_type(source, filename=None):
+    if filename is None:
+        filename = source if isinstance(source, (str, os.PathLike)) else getattr(source, "name", None)
+    suffix = Path(filename).suffix.lower() if isinstance(filename, (str, os.PathLike)) else ""
+    if suffix == ".pdf":
+        return "pdf"
+    if suffix in [".docx", ".doc"]:
+        return "docx"
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        head = bytes(source[:4])
+    elif hasattr(source, "read"):
+        position = source.tell()
+        head = source.read(4)
+        source.seek(position)
+    else:
+        return None
+    if head.startswith(b"%PDF"):
+        return "pdf"
+    if head.startswith(b"PK"):
+        return "docx"
+    return None
+
+def iter_pdf_pages(source, max_pages=None):
     try:
-        with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
+        with pdfplumber.open(open_source(source)) as pdf:
+            for i, page in enumerate(pdf.pages):
+                if max_pages is not None and i >= max_pages:
+                    break
                 page_text = page.extract_text()
+                page.close()
                 if page_text:
-                    text += page_text + "\n"
+                    yield page_text
     except Exception as e:
         logging.error(f"PDF error: {e}")
-    return text
 
-def extract_text_from_docx(file_path):
+def iter_docx_paragraphs(source):
     try:
-        doc = Document(file_path)
-        return "\n".join([para.text for para in doc.paragraphs])
+        doc = Document(open_source(source))
     except:
-        return ""
-
-def extract_text(file_path):
-    file_path = Path(file_path)
-    if file_path.suffix.lower() == ".pdf":
-        return extract_text_from_pdf(file_path)
-    elif file_path.suffix.lower() in [".docx", ".doc"]:
-        return extract_text_from_docx(file_path)
-    return ""
+        return
+    for para in doc.paragraphs:
+        yield para.text
+
+def iter_lines(source, max_pages=None, max_chars=None, filename=None):
+    max_pages = Config.CV_MAX_PAGES if max_pages is None else max_pages
+    remaining = Config.CV_MAX_CHARS if max_chars is None else max_chars
+
+    kind = document_type(source, filename)
+    if kind == "pdf":
+        chunks = iter_pdf_pages(source, max_pages)
+    elif kind == "docx":
+        chunks = iter_docx_paragraphs(source)
+    else:
+        return
+
+    for chunk in chunks:
+        for line in chunk.split("\n"):
+            if remaining <= 0:
+                chunks.close()
+                return
+            line = line[:remaining]
+            remaining -= len(line) + 1
+            yield line
+
+def extract_text_from_pdf(source):
+    return "\n".join(iter_pdf_pages(source))
+
+def extract_text_from_docx(source):
+    return "\n".join(iter_docx_paragraphs(source))
+
+def extract_text(source, filename=None):
+    return "\n".join(iter_lines(source, filename=filename))
+
+SECTION_MARKERS = {
+    "experience": ["experience", "work history", "employment", "career history"],
+    "education": ["education", "academic", "qualifications", "degrees"],
+    "skills": ["skills", "technologies", "technical skills", "competencies", "expertise"],
+    "projects": ["projects", "portfolio"]
+}
 
-def segment_sections(text):
-    text = text.lower()
-    sections = {
-        "experience": "",
-        "education": "",
-        "skills": "",
-        "projects": ""
-    }
-    
-    markers = {
-        "experience": ["experience", "work history", "employment", "career history"],
-        "education": ["education", "academic", "qualifications", "degrees"],
-        "skills": ["skills", "technologies", "technical skills", "competencies", "expertise"],
-        "projects": ["projects", "portfolio"]
-    }
+def segment_sections(lines):
+    if isinstance(lines, str):
+        lines = lines.split('\n')
+    sections = {section: [] for section in SECTION_MARKERS}
     
     current_section = None
-    lines = text.split('\n')
     
     for line in lines:
+        line = line.lower()
         clean_line = line.strip()
         found_new_section = False
         
-        for section, keywords in markers.items():
-            if any(k in clean_line for k in keywords) and len(clean_line) < 30:
-                current_section = section
-                found_new_section = True
-                break
+        if len(clean_line) < 30:
+            for section, keywords in SECTION_MARKERS.items():
+                if any(k in clean_line for k in keywords):
+                    current_section = section
+                    found_new_section = True
+                    break
         
         if found_new_section:
             continue
             
         if current_section:
-            sections[current_section] += line + "\n"
+            sections[current_section].append(line)
             
-    return sections
+    return {section: "".join(f"{line}\n" for line in body) for section, body in sections.items()}
 
 def extract_skills_from_cv(text):
     if not text:
         return []
     text = text.lower()
-    found = set()
-
-    for variant, standard in FLATTENED_SKILLS.items():
-        if re.search(r'\b' + re.escape(variant) + r'\b', text):
-            found.add(standard)
+    found = SKILL_MATCHER.find(text)
 
     if not found:
         for skill in SKILLS_DB.keys():
@@ -135,12 +144,18 @@ def extract_experience_years(text):
         total_years = len(years) * 2
     return total_years
 
-def parse_cv(file_path):
-    text = extract_text(file_path)
+def parse_cv(source, max_pages=None, max_chars=None, filename=None):
+    lines = []
+
+    def collect():
+        for line in iter_lines(source, max_pages, max_chars, filename):
+            lines.append(line)
+            yield line
+
+    sections = segment_sections(collect())
+    text = "\n".join(lines)
     if not text.strip():
         return {"raw_text": "", "skills": [], "parsed": False}
-
-    sections = segment_sections(text)
     
     skills = extract_skills_from_cv(text)
     
@@ -0,0 +1,165 @@
+import json
+import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from config import Config
+from core.cv_cache import PARSE_CACHE, content_hash, parse_cv_cached
+
+logger = logging.getLogger(__name__)
+
+
+class CVParseQueue:
+    CLEANUP_INTERVAL = 3600
+
+    def __init__(self, task_dir, upload_dir, max_workers, max_pending, task_timeout):
+        self.task_dir = Path(task_dir)
+        self.task_dir.mkdir(parents=True, exist_ok=True)
+        self.upload_dir = Path(upload_dir)
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.task_timeout = task_timeout
+        self._executor = None
+        self._pid = None
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._last_cleanup = 0
+
+    def _pool(self, broken=None):
+        with self._lock:
+            if broken is not None and self._executor is broken:
+                logger.warning("CV parse pool broke, starting a new one")
+                self._executor = None
+            if self._executor is None or self._pid != os.getpid():
+                if self._pid != os.getpid():
+                    self._slots = threading.BoundedSemaphore(self.max_pending)
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+                self._pid = os.getpid()
+            return self._executor
+
+    def _path(self, task_id):
+        return self.task_dir / f"{task_id}.json"
+
+    def _write(self, task_id, status):
+        fd, tmp_path = tempfile.mkstemp(dir=self.task_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(status, f)
+            os.replace(tmp_path, self._path(task_id))
+        except OSError as e:
+            logger.warning(f"CV task status write failed: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def _store(self, data, name):
+        path = self.upload_dir / name
+        if path.exists():
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=self.upload_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not store uploaded CV {name}: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def store(self, data, name):
+        threading.Thread(target=self._store, args=(data, name), daemon=True).start()
+
+    def submit(self, data, filename):
+        task_id = uuid.uuid4().hex
+        digest = content_hash(data)
+        stored_as = f"{digest}{Path(filename).suffix.lower()}"
+        status = {"id": task_id, "status": "queued", "filename": filename, "stored_as": stored_as,
+                  "created_at": time.time()}
+
+        cached = PARSE_CACHE.get(PARSE_CACHE.key(digest))
+        if cached is not None:
+            status.update({"status": "done", "result": cached, "finished_at": time.time(), "cached": True})
+            self._write(task_id, status)
+            self.store(data, stored_as)
+            return task_id
+
+        executor = self._pool()
+        if not self._slots.acquire(blocking=False):
+            return None
+        self._write(task_id, status)
+        try:
+            try:
+                future = executor.submit(parse_cv_cached, data, filename, digest)
+            except BrokenProcessPool:
+                future = self._pool(broken=executor).submit(parse_cv_cached, data, filename, digest)
+        except Exception:
+            self._slots.release()
+            self._path(task_id).unlink(missing_ok=True)
+            raise
+
+        slots = self._slots
+
+        def _done(fut):
+            slots.release()
+            try:
+                status.update({"status": "done", "result": fut.result()})
+            except Exception as e:
+                logger.warning(f"CV parse failed for {filename}: {e}")
+                status.update({"status": "error", "error": str(e)})
+            status["finished_at"] = time.time()
+            self._write(task_id, status)
+
+        future.add_done_callback(_done)
+        self.store(data, stored_as)
+        self._maybe_cleanup()
+        return task_id
+
+    def status(self, task_id):
+        if not task_id or not task_id.isalnum():
+            return None
+        try:
+            with open(self._path(task_id), "r", encoding="utf-8") as f:
+                status = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if status["status"] == "queued" and time.time() - status["created_at"] > self.task_timeout:
+            status.update({"status": "error", "error": "timed out"})
+        return status
+
+    def _maybe_cleanup(self):
+        now = time.time()
+        if now - self._last_cleanup < self.CLEANUP_INTERVAL:
+            return
+        self._last_cleanup = now
+        for path in self.task_dir.glob("*.json"):
+            try:
+                if now - path.stat().st_mtime > self.CLEANUP_INTERVAL * 24:
+                    path.unlink()
+            except OSError:
+                pass
+
+    def shutdown(self):
+        if self._executor is not None and self._pid == os.getpid():
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+CV_PARSE_QUEUE = CVParseQueue(
+    Config.CV_TASK_DIR,
+    Config.UPLOAD_FOLDER,
+    Config.CV_PARSE_WORKERS,
+    Config.CV_PARSE_MAX_PENDING,
+    Config.CV_TASK_TIMEOUT
+)
@@ -0,0 +1,134 @@
+import hashlib
+import random
+import re
+
+TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+
+ABBREVIATIONS = {
+    "sr": "senior", "snr": "senior", "jr": "junior", "jnr": "junior",
+    "mgr": "manager", "eng": "engineer", "engr": "engineer", "dev": "developer",
+    "swe": "software engineer", "ml": "machine learning", "ai": "artificial intelligence",
+    "i": "1", "ii": "2", "iii": "3",
+}
+COMPANY_SUFFIXES = {"inc", "llc", "ltd", "limited", "corp", "corporation", "co", "gmbh", "plc", "sa", "bv"}
+TITLE_NOISE = {"remote", "hybrid", "onsite", "fulltime", "full", "time", "contract", "m", "f", "d", "w"}
+
+NUM_PERM = 32
+BANDS = 8
+ROWS = NUM_PERM // BANDS
+MERSENNE = (1 << 61) - 1
+
+_rng = random.Random(1729)
+PERMUTATIONS = [(_rng.randrange(1, MERSENNE), _rng.randrange(0, MERSENNE)) for _ in range(NUM_PERM)]
+
+
+def _tokens(text):
+    return TOKEN_RE.findall((text or "").lower())
+
+
+def normalize_title(title):
+    words = []
+    for token in _tokens(title):
+        if token in TITLE_NOISE:
+            continue
+        words.extend(ABBREVIATIONS.get(token, token).split())
+    return frozenset(words)
+
+
+def normalize_company(company):
+    return frozenset(t for t in _tokens(company) if t not in COMPANY_SUFFIXES)
+
+
+def _hash(feature):
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def minhash(features):
+    hashes = [_hash(f) for f in features] or [0]
+    return tuple(min((a * h + b) % MERSENNE for h in hashes) for a, b in PERMUTATIONS)
+
+
+class JobSignature:
+    __slots__ = ("title", "company", "description", "minhash")
+
+    def __init__(self, job):
+        self.title = normalize_title(job.get("title"))
+        self.company = normalize_company(job.get("company"))
+        self.description = frozenset(_tokens(job.get("description")))
+        self.minhash = minhash(self.title)
+
+    def band_keys(self):
+        company = " ".join(sorted(self.company))
+        return [(company, i, self.minhash[i * ROWS:(i + 1) * ROWS]) for i in range(BANDS)]
+
+
+def _jaccard(a, b):
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def is_near_duplicate(a, b):
+    if a.company != b.company or _jaccard(a.title, b.title) < 0.75:
+        return False
+    if len(a.description) >= 30 and len(b.description) >= 30:
+        overlap = len(a.description & b.description) / min(len(a.description), len(b.description))
+        return overlap >= 0.5
+    return True
+
+
+def richness(job):
+    return (
+        len(job.get("description") or "")
+        + 50 * len(job.get("skills_extracted") or [])
+        + (200 if job.get("salary") else 0)
+    )
+
+
+class NearDuplicateIndex:
+    def __init__(self):
+        self._buckets = {}
+        self._signatures = {}
+
+    def __len__(self):
+        return len(self._signatures)
+
+    def find(self, signature):
+        checked = set()
+        for key in signature.band_keys():
+            for other_id in self._buckets.get(key, ()):
+                if other_id in checked:
+                    continue
+                checked.add(other_id)
+                if is_near_duplicate(signature, self._signatures[other_id]):
+                    return other_id
+        return None
+
+    def add(self, item_id, signature):
+        self._signatures[item_id] = signature
+        for key in signature.band_keys():
+            self._buckets.setdefault(key, []).append(item_id)
+
+    def add_if_new(self, item_id, job):
+        signature = JobSignature(job)
+        duplicate_of = self.find(signature)
+        if duplicate_of is None:
+            self.add(item_id, signature)
+        return duplicate_of
+
+
+def cluster_duplicates(items):
+    index = NearDuplicateIndex()
+    clusters = {}
+    for item_id, job in items:
+        root = index.add_if_new(item_id, job)
+        clusters.setdefault(item_id if root is None else root, []).append(item_id)
+    return list(clusters.values())
+
+
+def dedupe_jobs(jobs):
+    items = list(enumerate(jobs))
+    keep = []
+    for cluster in cluster_duplicates(items):
+        keep.append(max(cluster, key=lambda i: (richness(jobs[i]), -i)))
+    return [jobs[i] for i in sorted(keep)]
@@ -0,0 +1,69 @@
+import html as html_lib
+import re
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401
+    PARSER = "lxml"
+except ImportError:
+    PARSER = "html.parser"
+
+DESCRIPTION_CLASSES = {"show-more-less-html__markup", "jobs-description__content"}
+
+SCRIPT_RE = re.compile(r"<(script|style|button)\b(?:(?!\x00).)*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+TAG_RE = re.compile(r"<[^>\x00]*>")
+SPACE_RE = re.compile(r"[ \t\r\n\f\v\xa0]+")
+SEPARATOR = "\x00"
+SALARY_RE = re.compile(
+    r"\$[\d,]+(?:\.\d+)?\s*(K|k|M|m)?\s*(?:-\s*\$[\d,]+(?:\.\d+)?\s*(K|k|M|m)?)?(?:/(year|yr|hour|hr))?",
+    re.IGNORECASE
+)
+
+
+def _class_matcher(classes):
+    # While parsing, the class attribute is still the raw "a b c" string.
+    def match(value):
+        if value is None:
+            return False
+        values = value.split() if isinstance(value, str) else value
+        return any(v in classes for v in values)
+    return match
+
+
+def extract_description(page_html, classes=None, parser=None):
+    strainer = SoupStrainer("div", class_=_class_matcher(classes or DESCRIPTION_CLASSES))
+    soup = BeautifulSoup(page_html, parser or PARSER, parse_only=strainer)
+    desc = soup.find("div")
+    if desc is None:
+        return ""
+    for bad in desc.select("button, script, style"):
+        bad.decompose()
+    return desc.get_text(separator=" ", strip=True)
+
+
+def html_to_text(fragment):
+    return html_to_text_bulk([fragment])[0]
+
+
+def html_to_text_bulk(fragments):
+    if not fragments:
+        return []
+    joined = _clean(SEPARATOR.join(f.replace(SEPARATOR, " ") if f else "" for f in fragments))
+    parts = joined.split(SEPARATOR)
+    if len(parts) != len(fragments):
+        parts = [_clean(f.replace(SEPARATOR, " ")) if f else "" for f in fragments]
+    return [part.strip() for part in parts]
+
+
+def _clean(text):
+    text = SCRIPT_RE.sub(" ", text)
+    text = TAG_RE.sub(" ", text)
+    text = html_lib.unescape(text)
+    return SPACE_RE.sub(" ", text)
+
+
+def extract_salary(text):
+    if not text:
+        return ""
+    match = SALARY_RE.search(text)
+    return match.group(0) if match else ""
@@ -0,0 +1,382 @@
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter, OrderedDict
+from config import Config
+from core.dedup import cluster_duplicates, richness
+from core.text_similarity import (
+    NUMPY_AVAILABLE, TermStatistics, job_text, pack_vector, unpack_vector, vectorize
+)
+
+logger = logging.getLogger(__name__)
+
+REQUEST_FIELDS = ("id", "match_score", "missing_skills")
+DETAIL_FIELDS = ("description", "skills_extracted", "salary")
+
+
+def _normalize(value):
+    return re.sub(r"\s+", " ", str(value or "").strip().lower())
+
+
+def job_id_for(job):
+    url = (job.get("url") or "").split("?")[0].rstrip("/")
+    if url:
+        basis = f"{_normalize(job.get('source'))}|{_normalize(url)}"
+    else:
+        basis = "|".join(_normalize(job.get(k)) for k in ("title", "company", "location"))
+    return hashlib.sha1(basis.encode("utf-8")).hexdigest()[:16]
+
+
+def merge_record(stored, record):
+    merged = dict(record)
+    for key, value in stored.items():
+        if value and not merged.get(key):
+            merged[key] = value
+    if richness(merged) < richness(stored):
+        merged.update({key: stored[key] for key in DETAIL_FIELDS if key in stored})
+    return merged
+
+
+class JobStore:
+    EVICT_INTERVAL = 300
+    DEDUPE_INTERVAL = 3600
+    STATS_CHECK_INTERVAL = 30
+
+    def __init__(self, db_path, ttl, lru_size):
+        self.db_path = str(db_path)
+        self.ttl = ttl
+        self.lru_size = lru_size
+        self._lru = OrderedDict()
+        self._lru_lock = threading.Lock()
+        self._local = threading.local()
+        self._last_evict = 0
+        self._last_dedupe = 0
+        self._stats = None
+        self._stats_version = None
+        self._stats_checked = 0
+        self._stats_lock = threading.Lock()
+        self._init_schema()
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self):
+        with self._conn() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    saved INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+            if "vector" not in columns:
+                conn.execute("ALTER TABLE jobs ADD COLUMN vector BLOB")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_updated ON jobs (updated_at)")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS term_df (
+                    feature INTEGER PRIMARY KEY,
+                    df INTEGER NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS store_meta (
+                    key TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS job_ingest (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_id TEXT NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS match_scores (
+                    job_id TEXT NOT NULL,
+                    cv_key TEXT NOT NULL,
+                    score INTEGER NOT NULL,
+                    missing TEXT NOT NULL,
+                    PRIMARY KEY (job_id, cv_key)
+                )
+            """)
+
+    def _remember(self, job_id, job, vector=None, updated_at=None):
+        with self._lru_lock:
+            self._lru[job_id] = (job, vector, updated_at or time.time())
+            self._lru.move_to_end(job_id)
+            while len(self._lru) > self.lru_size:
+                self._lru.popitem(last=False)
+
+    def put_many(self, jobs):
+        if not jobs:
+            return []
+        now = time.time()
+        ids = []
+        rows = {}
+        for job in jobs:
+            job_id = job_id_for(job)
+            record = {k: v for k, v in job.items() if k not in REQUEST_FIELDS}
+            record["id"] = job_id
+            rows[job_id] = (json.dumps(record), record)
+            ids.append(job_id)
+
+        with self._conn() as conn:
+            placeholders = ",".join("?" * len(rows))
+            existing = {
+                job_id: (data, vector) for job_id, data, vector in conn.execute(
+                    f"SELECT id, data, vector FROM jobs WHERE id IN ({placeholders})", list(rows)
+                )
+            }
+            for job_id, (data, _) in existing.items():
+                record = merge_record(json.loads(data), rows[job_id][1])
+                rows[job_id] = (json.dumps(record), record)
+
+            changed = [job_id for job_id, (data, _) in rows.items()
+                       if job_id not in existing or existing[job_id][0] != data]
+            vectors = {}
+            removed_terms = []
+            for job_id in changed:
+                vectors[job_id] = vectorize(job_text(rows[job_id][1])) if NUMPY_AVAILABLE else None
+                if job_id in existing:
+                    removed_terms.append(existing[job_id][1])
+
+            conn.executemany("DELETE FROM match_scores WHERE job_id = ?", [(job_id,) for job_id in changed if job_id in existing])
+            conn.executemany("INSERT INTO job_ingest (job_id) VALUES (?)", [(job_id,) for job_id in changed])
+            conn.executemany("""
+                INSERT INTO jobs (id, data, updated_at, vector) VALUES (?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at,
+                    vector = COALESCE(excluded.vector, jobs.vector)
+            """, [(job_id, data, now, pack_vector(vectors.get(job_id))) for job_id, (data, _) in rows.items()])
+            self._update_terms(conn, [pack_vector(v) for v in vectors.values()], removed_terms)
+
+        for job_id, (_, record) in rows.items():
+            vector = vectors[job_id] if job_id in vectors else unpack_vector(existing[job_id][1])
+            self._remember(job_id, record, vector, now)
+
+        if now - self._last_evict > self.EVICT_INTERVAL:
+            self.evict_expired()
+        if now - self._last_dedupe > self.DEDUPE_INTERVAL:
+            self._last_dedupe = now
+            if self._claim_dedupe(now):
+                threading.Thread(target=self.dedupe, daemon=True).start()
+        return ids
+
+    def put(self, job):
+        return self.put_many([job])[0]
+
+    def _cached(self, job_id):
+        with self._lru_lock:
+            entry = self._lru.get(job_id)
+            if entry is not None:
+                self._lru.move_to_end(job_id)
+            return entry
+
+    def get(self, job_id):
+        entry = self._cached(job_id)
+        if entry is None or time.time() - entry[2] > self.ttl:
+            row = self._conn().execute(
+                "SELECT data, updated_at, saved, vector FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            data, updated_at, saved, vector = row
+            if saved <= 0 and time.time() - updated_at > self.ttl:
+                return None
+            entry = (json.loads(data), unpack_vector(vector) if NUMPY_AVAILABLE else None, updated_at)
+            self._remember(job_id, *entry)
+        return dict(entry[0])
+
+    def get_vectors(self, job_ids):
+        vectors = {}
+        missing = []
+        for job_id in job_ids:
+            entry = self._cached(job_id)
+            if entry is None:
+                missing.append(job_id)
+            else:
+                vectors[job_id] = entry[1]
+        if missing and NUMPY_AVAILABLE:
+            placeholders = ",".join("?" * len(missing))
+            for job_id, vector in self._conn().execute(
+                f"SELECT id, vector FROM jobs WHERE id IN ({placeholders})", missing
+            ):
+                vectors[job_id] = unpack_vector(vector)
+        return vectors
+
+    def _update_terms(self, conn, added, removed):
+        if not NUMPY_AVAILABLE:
+            return
+        added = [unpack_vector(b) for b in added if b]
+        removed = [unpack_vector(b) for b in removed if b]
+        if not added and not removed:
+            return
+
+        delta = Counter()
+        for indices, _ in added:
+            delta.update(indices.tolist())
+        for indices, _ in removed:
+            delta.subtract(indices.tolist())
+        conn.executemany("""
+            INSERT INTO term_df (feature, df) VALUES (?, ?)
+            ON CONFLICT(feature) DO UPDATE SET df = df + excluded.df
+        """, [(feature, count) for feature, count in delta.items() if count])
+        if removed:
+            conn.execute("DELETE FROM term_df WHERE df <= 0")
+        conn.execute("""
+            INSERT INTO store_meta (key, value) VALUES ('doc_count', ?)
+            ON CONFLICT(key) DO UPDATE SET value = MAX(value + excluded.value, 0)
+        """, (len(added) - len(removed),))
+        conn.execute("""
+            INSERT INTO store_meta (key, value) VALUES ('terms_version', 1)
+            ON CONFLICT(key) DO UPDATE SET value = value + 1
+        """)
+        version = conn.execute("SELECT value FROM store_meta WHERE key = 'terms_version'").fetchone()[0]
+        conn.execute("DELETE FROM match_scores")
+
+        with self._stats_lock:
+            if self._stats is not None and self._stats_version == version - 1:
+                self._stats.add(added)
+                self._stats.add(removed, sign=-1)
+                self._stats.version = self._stats_version = version
+
+    def term_stats(self):
+        with self._stats_lock:
+            now = time.time()
+            if self._stats is not None and now - self._stats_checked < self.STATS_CHECK_INTERVAL:
+                return self._stats
+            self._stats_checked = now
+
+            conn = self._conn()
+            meta = dict(conn.execute("SELECT key, value FROM store_meta"))
+            version = meta.get("terms_version", 0)
+            if self._stats is None or version != self._stats_version:
+                stats = TermStatistics(doc_count=meta.get("doc_count", 0), version=version)
+                for feature, df in conn.execute("SELECT feature, df FROM term_df"):
+                    stats.df[feature] = df
+                self._stats = stats
+                self._stats_version = version
+            return self._stats
+
+    def get_many(self, job_ids):
+        jobs = []
+        for job_id in job_ids:
+            job = self.get(job_id)
+            if job is not None:
+                jobs.append(job)
+        return jobs
+
+    def iter_since(self, since, batch_size=1000):
+        cutoff = time.time() - self.ttl
+        cursor = self._conn().execute(
+            "SELECT id, data, updated_at FROM jobs WHERE updated_at > ? AND (saved > 0 OR updated_at >= ?) "
+            "ORDER BY updated_at",
+            (since, cutoff)
+        )
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for job_id, data, updated_at in rows:
+                yield job_id, json.loads(data), updated_at
+
+    def latest_seq(self):
+        return self._conn().execute("SELECT COALESCE(MAX(seq), 0) FROM job_ingest").fetchone()[0]
+
+    def jobs_since(self, seq, limit=1000):
+        rows = self._conn().execute("""
+            SELECT i.seq, j.id, j.data FROM job_ingest i JOIN jobs j ON j.id = i.job_id
+            WHERE i.seq > ? ORDER BY i.seq LIMIT ?
+        """, (seq, limit)).fetchall()
+        return [(row_seq, job_id, json.loads(data)) for row_seq, job_id, data in rows]
+
+    def get_scores(self, cv_key, job_ids):
+        if not job_ids:
+            return {}
+        placeholders = ",".join("?" * len(job_ids))
+        rows = self._conn().execute(
+            f"SELECT job_id, score, missing FROM match_scores WHERE cv_key = ? AND job_id IN ({placeholders})",
+            [cv_key, *job_ids]
+        )
+        return {job_id: (score, json.loads(missing)) for job_id, score, missing in rows}
+
+    def put_scores(self, cv_key, scores):
+        with self._conn() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO match_scores (job_id, cv_key, score, missing) VALUES (?, ?, ?, ?)",
+                [(job_id, cv_key, score, json.dumps(missing)) for job_id, (score, missing) in scores.items()]
+            )
+
+    def set_saved(self, job_id, saved):
+        delta = 1 if saved else -1
+        with self._conn() as conn:
+            conn.execute("UPDATE jobs SET saved = MAX(saved + ?, 0) WHERE id = ?", (delta, job_id))
+
+    def evict_expired(self):
+        self._last_evict = time.time()
+        cutoff = self._last_evict - self.ttl
+        with self._conn() as conn:
+            rows = conn.execute(
+                "SELECT id, vector FROM jobs WHERE updated_at < ? AND saved <= 0", (cutoff,)
+            ).fetchall()
+            expired = [job_id for job_id, _ in rows]
+            conn.execute("DELETE FROM jobs WHERE updated_at < ? AND saved <= 0", (cutoff,))
+            self._update_terms(conn, [], [vector for _, vector in rows])
+            conn.execute("DELETE FROM match_scores WHERE job_id NOT IN (SELECT id FROM jobs)")
+            conn.execute("DELETE FROM job_ingest WHERE job_id NOT IN (SELECT id FROM jobs)")
+        with self._lru_lock:
+            for job_id in expired:
+                self._lru.pop(job_id, None)
+        if expired:
+            logger.info(f"Evicted {len(expired)} expired jobs")
+        return len(expired)
+
+    def _claim_dedupe(self, now):
+        with self._conn() as conn:
+            conn.execute("INSERT OR IGNORE INTO store_meta (key, value) VALUES ('last_dedupe', 0)")
+            return conn.execute(
+                "UPDATE store_meta SET value = ? WHERE key = 'last_dedupe' AND value <= ?",
+                (int(now), int(now - self.DEDUPE_INTERVAL)),
+            ).rowcount == 1
+
+    def dedupe(self):
+        rows = self._conn().execute("SELECT id, data, saved, vector FROM jobs ORDER BY updated_at DESC").fetchall()
+        jobs = {job_id: json.loads(data) for job_id, data, _, _ in rows}
+        saved = {job_id for job_id, _, count, _ in rows if count > 0}
+        vectors = {job_id: vector for job_id, _, _, vector in rows}
+
+        duplicates = []
+        for cluster in cluster_duplicates(jobs.items()):
+            if len(cluster) < 2:
+                continue
+            keep = max(cluster, key=lambda job_id: richness(jobs[job_id]))
+            duplicates.extend(job_id for job_id in cluster if job_id != keep and job_id not in saved)
+
+        with self._conn() as conn:
+            conn.executemany("DELETE FROM jobs WHERE id = ?", [(job_id,) for job_id in duplicates])
+            conn.executemany("DELETE FROM match_scores WHERE job_id = ?", [(job_id,) for job_id in duplicates])
+            self._update_terms(conn, [], [vectors[job_id] for job_id in duplicates])
+        with self._lru_lock:
+            for job_id in duplicates:
+                self._lru.pop(job_id, None)
+        if duplicates:
+            logger.info(f"Removed {len(duplicates)} near-duplicate jobs")
+        return len(duplicates)
+
+    def count(self):
+        return self._conn().execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+
+JOB_STORE = JobStore(Config.JOBS_DB_PATH, Config.JOB_TTL, Config.JOB_LRU_SIZE)
@@ -1,5 +1,21 @@
 
+import bisect
+import hashlib
+import heapq
+import json
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from core.text_similarity import similarity_batch, vectorize
+
 class MatchScoreEngine:
+    VERSION = 2
+    RERANK_FACTOR = 5
+
     def __init__(self):
         self.weights = {
             "skills": 0.50,
@@ -15,39 +31,54 @@ class MatchScoreEngine:
             "machine learning", "deep learning", "nlp", "tensorflow", "pytorch",
             "pandas", "git", "linux", "ci/cd", "terraform", "typescript"
         }
+        self._cv_vectors = {}
 
-    def calculate_score(self, job, cv_data):
-        if not cv_data or not cv_data.get('parsed'):
-            return 0, []
+    def cv_key(self, cv_data):
+        basis = {
+            "version": self.VERSION,
+            "skills": sorted(s.lower() for s in cv_data.get('skills', [])),
+            "experience_years": cv_data.get('experience_years', 0),
+            "text": hashlib.sha1((cv_data.get('raw_text') or '').encode("utf-8")).hexdigest()
+        }
+        return hashlib.sha1(json.dumps(basis).encode("utf-8")).hexdigest()
 
-        user_skills = set(s.lower() for s in cv_data.get('skills', []))
-        
+    def cv_vector(self, cv_data):
+        if not NUMPY_AVAILABLE or not cv_data:
+            return None
+        key = self.cv_key(cv_data)
+        if key not in self._cv_vectors:
+            if len(self._cv_vectors) > 256:
+                self._cv_vectors.clear()
+            self._cv_vectors[key] = vectorize(cv_data.get('raw_text'))
+        return self._cv_vectors[key]
+
+    def text_scores(self, cv_data, vectors, stats):
+        if not NUMPY_AVAILABLE:
+            return None
+        return similarity_batch(self.cv_vector(cv_data), vectors, stats)
+
+    def _job_skills(self, job):
         job_skills = set(s.lower() for s in job.get('skills_extracted', []))
         if not job_skills:
             title_words = set(job['title'].lower().split())
             job_skills = {w for w in title_words if len(w) > 3}
+        return job_skills
 
-        skills_score = self._calculate_skills_score(user_skills, job_skills)
+    def calculate_score(self, job, cv_data, text_score=None):
+        if not cv_data or not cv_data.get('parsed'):
+            return 0, []
+
+        user_skills = set(s.lower() for s in cv_data.get('skills', []))
         
-        keywords_score = skills_score 
+        job_skills = self._job_skills(job)
+
+        skills_score = self._calculate_skills_score(user_skills, job_skills)
         
         experience_score = 100
         if "senior" in job['title'].lower() and cv_data.get('experience_years', 0) < 3:
             experience_score = 40
-            
-        education_score = 100
-        
-        formatting_score = 100
 
-        final_score = (
-            skills_score * self.weights['skills'] +
-            keywords_score * self.weights['keywords'] +
-            experience_score * self.weights['experience'] +
-            education_score * self.weights['education'] +
-            formatting_score * self.weights['formatting']
-        )
-        
-        final_score = min(int(final_score), 98)
+        final_score = min(int(self._combine(skills_score, experience_score, text_score)), 98)
         
         missing = [s.title() for s in (job_skills - user_skills) if s in self.critical_skills]
         
@@ -70,3 +101,270 @@ class MatchScoreEngine:
             return 0
             
         return (matched / total_weight) * 100
+
+    def _combine(self, skills_score, experience_score, keywords_score=None):
+        if keywords_score is None:
+            keywords_score = skills_score
+        education_score = 100
+        formatting_score = 100
+
+        return (
+            skills_score * self.weights['skills'] +
+            keywords_score * self.weights['keywords'] +
+            experience_score * self.weights['experience'] +
+            education_score * self.weights['education'] +
+            formatting_score * self.weights['formatting']
+        )
+
+    def build_matrix(self, jobs):
+        return JobSkillMatrix(self, jobs)
+
+    def score_batch(self, matrix, cv_data, text_scores=None):
+        if not cv_data or not cv_data.get('parsed') or not len(matrix):
+            return np.zeros(len(matrix), dtype=np.int64)
+
+        user_mask = matrix.user_mask(cv_data.get('skills', []))
+        matched = np.bincount(
+            matrix.rows, weights=matrix.weights * user_mask[matrix.indices], minlength=len(matrix)
+        )
+
+        skills_score = np.zeros(len(matrix))
+        has_skills = matrix.total_weight > 0
+        skills_score[has_skills] = (matched[has_skills] / matrix.total_weight[has_skills]) * 100
+
+        experience_score = np.full(len(matrix), 100.0)
+        if cv_data.get('experience_years', 0) < 3:
+            experience_score[matrix.senior] = 40
+
+        keywords_score = None
+        if text_scores is not None:
+            keywords_score = np.where(np.isnan(text_scores), skills_score, text_scores)
+
+        final_score = self._combine(skills_score, experience_score, keywords_score)
+        return np.minimum(final_score.astype(np.int64), 98)
+
+    def missing_batch(self, matrix, cv_data, rows=None):
+        if rows is None:
+            rows = range(len(matrix))
+        if not cv_data or not cv_data.get('parsed'):
+            return [[] for _ in rows]
+
+        user_mask = matrix.user_mask(cv_data.get('skills', []))
+        missing_mask = matrix.critical & ~user_mask
+        results = []
+        for row in rows:
+            skill_ids = matrix.indices[matrix.indptr[row]:matrix.indptr[row + 1]]
+            missing = skill_ids[missing_mask[skill_ids]][:6]
+            results.append([matrix.vocabulary[i].title() for i in missing])
+        return results
+
+    def score_jobs(self, jobs, cv_data, text_scores=None):
+        if not NUMPY_AVAILABLE:
+            return [self.calculate_score(job, cv_data) for job in jobs]
+
+        matrix = self.build_matrix(jobs)
+        scores = self.score_batch(matrix, cv_data, text_scores)
+        missing = self.missing_batch(matrix, cv_data)
+        return [(int(score), skills) for score, skills in zip(scores, missing)]
+
+    def top_k(self, index, cv_data, k=20, text_scores=None):
+        if not cv_data or not cv_data.get('parsed') or k <= 0:
+            return []
+
+        user_ids = {index.skill_ids[s.lower()] for s in cv_data.get('skills', []) if s.lower() in index.skill_ids}
+        junior = cv_data.get('experience_years', 0) < 3
+        pool = k * self.RERANK_FACTOR if text_scores else k
+
+        postings = [index.postings(skill_id) for skill_id in user_ids]
+        postings = [p for p in postings if p[0]]
+        positions = [0] * len(postings)
+        seen = set()
+        top = []
+
+        while True:
+            bound = 0.0
+            for (rows, impacts), pos in zip(postings, positions):
+                if pos < len(rows):
+                    bound += impacts[pos]
+            if bound == 0:
+                break
+            if len(top) == pool and self._combine(min(bound, 1.0) * 100, 100) <= top[0][0]:
+                break
+
+            fresh = []
+            for i, (rows, impacts) in enumerate(postings):
+                pos = positions[i]
+                if pos >= len(rows):
+                    continue
+                positions[i] = pos + 1
+                row = rows[pos]
+                if row in seen or index.is_dead(row):
+                    continue
+                seen.add(row)
+                fresh.append(row)
+
+            for row in fresh:
+                score = self._row_score(index, row, user_ids, junior)
+                if len(top) < pool:
+                    heapq.heappush(top, (score, -row))
+                elif score > top[0][0]:
+                    heapq.heapreplace(top, (score, -row))
+
+        if text_scores and top:
+            rows = [-neg_row for _, neg_row in top]
+            keywords = text_scores([index.job_ids[row] for row in rows])
+            top = [
+                (self._row_score(index, row, user_ids, junior, None if np.isnan(s) else s), -row)
+                for row, s in zip(rows, keywords)
+            ]
+
+        results = []
+        for score, neg_row in heapq.nlargest(k, top):
+            row = -neg_row
+            missing = [index.vocabulary[s].title() for s in index.row_skills(row)
+                       if index._critical[s] and s not in user_ids][:6]
+            results.append((index.job_ids[row], min(int(score), 98), missing))
+        return results
+
+    def _row_score(self, index, row, user_ids, junior, keywords_score=None):
+        total_weight = index.totals[row]
+        matched = sum(3 if index._critical[s] else 1 for s in index.row_skills(row) if s in user_ids)
+        skills_score = (matched / total_weight) * 100 if total_weight else 0
+
+        experience_score = 40 if junior and index._senior[row] else 100
+
+        return self._combine(skills_score, experience_score, keywords_score)
+
+
+class JobSkillMatrix:
+    def __init__(self, engine, jobs=()):
+        self.engine = engine
+        self.vocabulary = []
+        self.skill_ids = {}
+        self._critical = []
+        self._indices = []
+        self._indptr = [0]
+        self._senior = []
+        self._dirty = True
+        self.add_jobs(jobs)
+
+    def __len__(self):
+        return len(self._senior)
+
+    def skill_id(self, skill):
+        skill_id = self.skill_ids.get(skill)
+        if skill_id is None:
+            skill_id = len(self.vocabulary)
+            self.skill_ids[skill] = skill_id
+            self.vocabulary.append(skill)
+            self._critical.append(skill in self.engine.critical_skills)
+        return skill_id
+
+    def add_jobs(self, jobs):
+        for job in jobs:
+            self._indices.extend(sorted(self.skill_id(s) for s in self.engine._job_skills(job)))
+            self._indptr.append(len(self._indices))
+            self._senior.append("senior" in job['title'].lower())
+        self._dirty = True
+
+    def _build(self):
+        self._indices_arr = np.asarray(self._indices, dtype=np.int32)
+        self._indptr_arr = np.asarray(self._indptr, dtype=np.int64)
+        self._critical_arr = np.asarray(self._critical, dtype=bool)
+        self._weights = np.where(self._critical_arr[self._indices_arr], 3.0, 1.0)
+        self._rows = np.repeat(np.arange(len(self), dtype=np.int32), np.diff(self._indptr_arr))
+        self._total_weight = np.bincount(self._rows, weights=self._weights, minlength=len(self))
+        self._senior_arr = np.asarray(self._senior, dtype=bool)
+        self._dirty = False
+
+    def _array(self, name):
+        if self._dirty:
+            self._build()
+        return getattr(self, name)
+
+    indices = property(lambda self: self._array('_indices_arr'))
+    indptr = property(lambda self: self._array('_indptr_arr'))
+    critical = property(lambda self: self._array('_critical_arr'))
+    weights = property(lambda self: self._array('_weights'))
+    rows = property(lambda self: self._array('_rows'))
+    total_weight = property(lambda self: self._array('_total_weight'))
+    senior = property(lambda self: self._array('_senior_arr'))
+
+    def user_mask(self, skills):
+        mask = np.zeros(len(self.vocabulary), dtype=bool)
+        for skill in skills:
+            skill_id = self.skill_ids.get(skill.lower())
+            if skill_id is not None:
+                mask[skill_id] = True
+        return mask
+
+
+class JobSkillIndex(JobSkillMatrix):
+    def __init__(self, engine):
+        super().__init__(engine)
+        self.job_ids = []
+        self.rows_by_id = {}
+        self.totals = []
+        self.dead = {}
+        self.visible = 0
+        self._postings = {}
+        self._sorted = {}
+
+    def row_skills(self, row):
+        return self._indices[self._indptr[row]:self._indptr[row + 1]]
+
+    def add(self, job_id, job):
+        row = len(self)
+        self.add_jobs([job])
+        self.job_ids.append(job_id)
+
+        skills = self.row_skills(row)
+        self.totals.append(sum(3 if self._critical[s] else 1 for s in skills))
+        for skill_id in skills:
+            self._postings.setdefault(skill_id, []).append(row)
+        self.visible = row + 1
+
+        old_row = self.rows_by_id.get(job_id)
+        if old_row is not None:
+            self.dead[old_row] = self.visible
+        self.rows_by_id[job_id] = row
+
+    def remove(self, job_id):
+        row = self.rows_by_id.pop(job_id, None)
+        if row is not None:
+            self.dead[row] = 0
+
+    def is_dead(self, row, size=None):
+        return row in self.dead and (size is None or self.dead[row] <= size)
+
+    def postings(self, skill_id, size=None):
+        rows = self._postings.get(skill_id, [])
+        count = len(rows) if size is None else bisect.bisect_left(rows, size)
+        ordered = self._sorted.get(skill_id)
+        if ordered is None or ordered[0] != count:
+            weight = 3 if self._critical[skill_id] else 1
+            rows = sorted(rows[:count], key=lambda r: (self.totals[r], r))
+            ordered = (count, rows, [weight / self.totals[r] for r in rows])
+            self._sorted[skill_id] = ordered
+        return ordered[1], ordered[2]
+
+    def live_count(self):
+        return self.visible - len(self.dead)
+
+    def snapshot(self):
+        return JobIndexSnapshot(self)
+
+
+class JobIndexSnapshot:
+    def __init__(self, index):
+        self.index = index
+        self.size = index.visible
+
+    def __getattr__(self, name):
+        return getattr(self.index, name)
+
+    def is_dead(self, row):
+        return self.index.is_dead(row, self.size)
+
+    def postings(self, skill_id):
+        return self.index.postings(skill_id, self.size)
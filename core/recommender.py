@@ -0,0 +1,95 @@
+import logging
+import threading
+import time
+from config import Config
+from core.job_store import JOB_STORE
+from core.matcher import MatchScoreEngine, JobSkillIndex
+
+logger = logging.getLogger(__name__)
+
+
+class JobRecommender:
+    def __init__(self, store, engine, rebuild_interval):
+        self.store = store
+        self.engine = engine
+        self.rebuild_interval = rebuild_interval
+        self.index = None
+        self.built_at = 0
+        self.synced_seq = 0
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+
+    def _build(self):
+        seq = self.store.latest_seq()
+        index = JobSkillIndex(self.engine)
+        for job_id, job, _ in self.store.iter_since(0):
+            index.add(job_id, job)
+        return index, seq
+
+    def _sync(self, index, seq):
+        added = 0
+        while True:
+            rows = self.store.jobs_since(seq)
+            if not rows:
+                return seq, added
+            for seq, job_id, job in rows:
+                index.add(job_id, job)
+            added += len(rows)
+
+    def _swap(self, index, seq):
+        with self._lock:
+            seq, _ = self._sync(index, seq)
+            self.index, self.synced_seq, self.built_at = index, seq, time.time()
+        logger.info(f"Recommendation index built: {index.live_count()} jobs")
+
+    def _rebuild(self):
+        try:
+            self._swap(*self._build())
+        except Exception as e:
+            logger.warning(f"Recommendation index rebuild failed: {e}")
+        finally:
+            self._build_lock.release()
+
+    def refresh(self):
+        if self.index is None:
+            with self._build_lock:
+                if self.index is None:
+                    self._swap(*self._build())
+
+        if self._lock.acquire(blocking=False):
+            try:
+                index = self.index
+                self.synced_seq, added = self._sync(index, self.synced_seq)
+                if added:
+                    logger.info(f"Recommendation index updated: {added} jobs")
+                stale = time.time() - self.built_at > self.rebuild_interval or len(index.dead) > index.live_count()
+            finally:
+                self._lock.release()
+            if stale and self._build_lock.acquire(blocking=False):
+                threading.Thread(target=self._rebuild, daemon=True).start()
+        return self.index.snapshot()
+
+    def recommend(self, cv_data, k=None):
+        k = k or Config.RECOMMEND_TOP_K
+        index = self.refresh()
+        stats = self.store.term_stats()
+
+        def text_scores(job_ids):
+            vectors = self.store.get_vectors(job_ids)
+            return self.engine.text_scores(cv_data, [vectors.get(job_id) for job_id in job_ids], stats)
+
+        ranked = self.engine.top_k(index, cv_data, k, text_scores if self.engine.cv_vector(cv_data) else None)
+
+        jobs = []
+        for job_id, score, missing in ranked:
+            job = self.store.get(job_id)
+            if job is None:
+                with self._lock:
+                    index.remove(job_id)
+                continue
+            job['match_score'], job['missing_skills'] = score, missing
+            jobs.append(job)
+        return jobs
+
+
+RECOMMENDER = JobRecommender(JOB_STORE, MatchScoreEngine(), Config.RECOMMEND_REBUILD_INTERVAL)
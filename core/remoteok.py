@@ -0,0 +1,196 @@
+import asyncio
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from config import Config
+from core.skills import extract_skills
+from core.html_extract import extract_salary, html_to_text_bulk
+
+logger = logging.getLogger(__name__)
+
+TOKEN_RE = re.compile(r"[a-z0-9+#.]+")
+
+
+def _tokens(text):
+    return set(TOKEN_RE.findall((text or "").lower()))
+
+
+class RemoteOKSnapshot:
+    def __init__(self, path, url, refresh_interval):
+        self.path = Path(path)
+        self.url = url
+        self.refresh_interval = refresh_interval
+        self.jobs = []
+        self.titles = []
+        self.title_index = {}
+        self.tag_index = {}
+        self.etag = None
+        self.last_modified = None
+        self.fetched_at = 0
+        self.loaded_mtime = 0
+        self._lock = None
+        self._refresh_task = None
+
+    def _build(self, data):
+        items = [item for item in data if isinstance(item, dict) and item.get('position')]
+        descriptions = html_to_text_bulk([item.get('description') or '' for item in items])
+
+        jobs = []
+        for item, clean_desc in zip(items, descriptions):
+            tags = [t for t in item.get('tags', []) if isinstance(t, str)]
+            jobs.append({
+                "title": item.get('position'),
+                "company": item.get('company'),
+                "location": item.get('location', 'Remote'),
+                "url": item.get('url'),
+                "source": "RemoteOK",
+                "description": clean_desc[:500] + "...",
+                "salary": extract_salary(clean_desc),
+                "skills_extracted": tags + extract_skills(clean_desc),
+                "tags": tags,
+                "match_score": 0
+            })
+        return jobs
+
+    def _index(self, jobs):
+        title_index = {}
+        tag_index = {}
+        for i, job in enumerate(jobs):
+            for token in _tokens(job["title"]):
+                title_index.setdefault(token, []).append(i)
+            for token in _tokens(" ".join(job["tags"])):
+                tag_index.setdefault(token, []).append(i)
+        self.jobs = jobs
+        self.titles = [(job["title"] or "").lower() for job in jobs]
+        self.title_index = title_index
+        self.tag_index = tag_index
+
+    def load(self):
+        try:
+            mtime = self.path.stat().st_mtime
+            with open(self.path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        self._index(snapshot.get("jobs", []))
+        self.etag = snapshot.get("etag")
+        self.last_modified = snapshot.get("last_modified")
+        self.fetched_at = snapshot.get("fetched_at", 0)
+        self.loaded_mtime = mtime
+        logger.info(f"RemoteOK snapshot loaded: {len(self.jobs)} jobs")
+        return True
+
+    def _save(self):
+        snapshot = {
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "fetched_at": self.fetched_at,
+            "jobs": self.jobs
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f)
+            os.replace(tmp_path, self.path)
+            self.loaded_mtime = self.path.stat().st_mtime
+        except OSError as e:
+            logger.warning(f"RemoteOK snapshot write failed: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def is_fresh(self):
+        return self.jobs and time.time() - self.fetched_at < self.refresh_interval
+
+    async def refresh(self, session, force=False):
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            try:
+                if self.path.stat().st_mtime > self.loaded_mtime:
+                    self.load()
+            except OSError:
+                pass
+
+            if self.is_fresh() and not force:
+                return
+
+            headers = {}
+            if self.jobs and self.etag:
+                headers["If-None-Match"] = self.etag
+            if self.jobs and self.last_modified:
+                headers["If-Modified-Since"] = self.last_modified
+
+            try:
+                async with session.get(self.url, headers=headers) as resp:
+                    if resp.status == 304:
+                        logger.info("RemoteOK feed not modified")
+                    else:
+                        resp.raise_for_status()
+                        data = await resp.json(content_type=None)
+                        jobs = await asyncio.get_running_loop().run_in_executor(None, self._build, data)
+                        self._index(jobs)
+                        self.etag = resp.headers.get("ETag")
+                        self.last_modified = resp.headers.get("Last-Modified")
+                        logger.info(f"RemoteOK snapshot refreshed: {len(self.jobs)} jobs")
+            except Exception as e:
+                if not self.jobs:
+                    raise
+                logger.warning(f"RemoteOK refresh failed, serving snapshot: {e}")
+                return
+
+            self.fetched_at = time.time()
+            self._save()
+
+    async def ensure_fresh(self, session):
+        if not self.jobs:
+            await self.refresh(session)
+        elif not self.is_fresh() and (self._refresh_task is None or self._refresh_task.done()):
+            self._refresh_task = asyncio.ensure_future(self.refresh(session))
+
+    def _lookup(self, index, tokens):
+        postings = [index.get(t) for t in tokens]
+        if not postings or not all(postings):
+            return set()
+        postings.sort(key=len)
+        matched = set(postings[0])
+        for p in postings[1:]:
+            matched.intersection_update(p)
+        return matched
+
+    def search(self, role, max_jobs=10):
+        role = (role or "").lower().strip()
+        tokens = _tokens(role)
+        if not tokens:
+            return []
+
+        by_title = sorted(i for i in self._lookup(self.title_index, tokens) if role in self.titles[i])
+        if not by_title:
+            by_title = [i for i, title in enumerate(self.titles) if role in title]
+        hits = by_title[:max_jobs]
+        if len(hits) < max_jobs:
+            seen = set(hits)
+            by_tag = sorted(self._lookup(self.tag_index, tokens) - seen)
+            hits += by_tag[:max_jobs - len(hits)]
+
+        results = []
+        for i in hits:
+            job = dict(self.jobs[i])
+            job.pop("tags", None)
+            job["skills_extracted"] = list(job["skills_extracted"])
+            results.append(job)
+        return results
+
+
+REMOTEOK_SNAPSHOT = RemoteOKSnapshot(
+    Config.REMOTEOK_SNAPSHOT_PATH,
+    Config.REMOTEOK_API_URL,
+    Config.REMOTEOK_REFRESH_INTERVAL
+)
@@ -0,0 +1,104 @@
+import asyncio
+import atexit
+import logging
+import os
+import threading
+import aiohttp
+from config import Config
+from core.browser_pool import check_browser_pool, close_browser_pool
+
+logger = logging.getLogger(__name__)
+
+
+class ScrapeRuntime:
+    def __init__(self):
+        self.pid = os.getpid()
+        self.loop = asyncio.new_event_loop()
+        self._session = None
+        self._health_task = None
+        self._thread = threading.Thread(target=self._run, name="scrape-runtime", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self._health_task = self.loop.create_task(self._check_browsers())
+        self.loop.run_forever()
+
+    async def _check_browsers(self):
+        while True:
+            await asyncio.sleep(Config.BROWSER_HEALTH_INTERVAL)
+            try:
+                health = await check_browser_pool()
+            except Exception as e:
+                logger.warning(f"Browser pool health check failed: {e}")
+                continue
+            if health and (health["reaped"] or health["healthy"] < health["browsers"]):
+                logger.warning(f"Browser pool health: {health}")
+
+    def submit(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro, timeout=None):
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    async def get_session(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=Config.HTTP_POOL_SIZE,
+                limit_per_host=Config.HTTP_POOL_PER_HOST,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=Config.SCRAPE_TIMEOUT)
+            )
+        return self._session
+
+    async def _close(self):
+        if self._health_task is not None:
+            self._health_task.cancel()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        await close_browser_pool()
+
+    def shutdown(self, timeout=10):
+        if not self.loop.is_running():
+            return
+        try:
+            self.submit(self._close()).result(timeout)
+        except Exception as e:
+            logger.warning(f"Scrape runtime shutdown failed: {e}")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
+
+
+_RUNTIME = None
+_RUNTIME_LOCK = threading.Lock()
+
+
+def get_runtime():
+    global _RUNTIME
+    with _RUNTIME_LOCK:
+        # A runtime inherited through fork() has no running loop thread.
+        if _RUNTIME is None or _RUNTIME.pid != os.getpid():
+            _RUNTIME = ScrapeRuntime()
+        return _RUNTIME
+
+
+async def get_http_session():
+    runtime = get_runtime()
+    if asyncio.get_running_loop() is not runtime.loop:
+        raise RuntimeError("get_http_session() must be awaited on the scrape runtime loop")
+    return await runtime.get_session()
+
+
+@atexit.register
+def _shutdown_runtime():
+    if _RUNTIME is not None and _RUNTIME.pid == os.getpid():
+        _RUNTIME.shutdown()
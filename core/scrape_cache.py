@@ -0,0 +1,118 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_query(role: str, location: str = "") -> str:
+    role = re.sub(r"\s+", " ", (role or "").strip().lower())
+    location = re.sub(r"\s+", " ", (location or "").strip().lower())
+    return f"{role}|{location}"
+
+
+class ScrapeCache:
+    LOCK_TIMEOUT = 300
+    SWEEP_INTERVAL = 3600
+
+    def __init__(self, cache_dir, ttl, stale_ttl):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._last_sweep = 0
+
+    def _path(self, key):
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None, False
+
+        age = time.time() - entry.get("stored_at", 0)
+        if age > self.ttl + self.stale_ttl:
+            path.unlink(missing_ok=True)
+            return None, False
+        is_stale = age > self.ttl or not entry.get("complete", True)
+        return entry.get("jobs", []), is_stale
+
+    def set(self, key, jobs, complete=True):
+        path = self._path(key)
+        entry = {"key": key, "stored_at": time.time(), "complete": complete, "jobs": jobs}
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Scrape cache write failed: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+        if time.time() - self._last_sweep > self.SWEEP_INTERVAL:
+            self.sweep()
+
+    def sweep(self):
+        self._last_sweep = now = time.time()
+        removed = 0
+        for path in self.cache_dir.iterdir():
+            try:
+                age = now - path.stat().st_mtime
+                if path.suffix == ".json" and age > self.ttl + self.stale_ttl:
+                    path.unlink()
+                    removed += 1
+                elif path.suffix == ".tmp" and age > self.LOCK_TIMEOUT:
+                    path.unlink()
+            except OSError:
+                pass
+        if removed:
+            logger.info(f"Removed {removed} expired scrape cache entries")
+        return removed
+
+    def try_lock(self, key):
+        lock_path = self._path(key).with_suffix(".lock")
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            os.close(fd)
+            return True
+        except FileExistsError:
+            try:
+                if time.time() - lock_path.stat().st_mtime > self.LOCK_TIMEOUT:
+                    os.unlink(lock_path)
+                    return self.try_lock(key)
+            except OSError:
+                pass
+            return False
+
+    def unlock(self, key):
+        try:
+            os.unlink(self._path(key).with_suffix(".lock"))
+        except OSError:
+            pass
+
+    def refresh_in_background(self, key, fetch):
+        if not self.try_lock(key):
+            return
+
+        def _run():
+            try:
+                fetch()
+            except Exception as e:
+                logger.warning(f"Background refresh failed for '{key}': {e}")
+            finally:
+                self.unlock(key)
+
+        threading.Thread(target=_run, daemon=True).start()
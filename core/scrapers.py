@@ -1,197 +1,335 @@
 import asyncio
-from playwright.async_api import async_playwright
-from urllib.parse import urljoin, quote
-from bs4 import BeautifulSoup
-import re
+from urllib.parse import urljoin, urlparse, quote
 import random
 import logging
-import aiohttp
+import threading
+import time
+from concurrent.futures import wait as wait_futures, FIRST_COMPLETED
+from config import Config
+from core.scrape_cache import ScrapeCache, normalize_query
+from core.skills import extract_skills
+from core.html_extract import extract_description, extract_salary
+from core.dedup import NearDuplicateIndex, dedupe_jobs, richness
+from core.browser_pool import get_browser_pool
+from core.runtime import get_runtime, get_http_session
+from core.remoteok import REMOTEOK_SNAPSHOT
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def extract_salary(text: str) -> str:
-    if not text:
-        return ""
-    pattern = r"\$[\d,]+(?:\.\d+)?\s*(K|k|M|m)?\s*(?:-\s*\$[\d,]+(?:\.\d+)?\s*(K|k|M|m)?)?(?:/(year|yr|hour|hr))?"
-    match = re.search(pattern, text, re.IGNORECASE)
-    return match.group(0) if match else ""
-
-def extract_skills(text: str):
-    if not text:
-        return []
-    text = text.lower()
-    skills = {
-        "python", "sql", "aws", "azure", "gcp", "docker", "kubernetes", "tensorflow", "pytorch",
-        "pandas", "numpy", "spark", "hadoop", "tableau", "power bi", "excel", "machine learning",
-        "deep learning", "nlp", "llm", "scikit-learn", "git", "airflow", "kafka", "react", "javascript",
-        "typescript", "node.js", "java", "scala", "r", "statistics", "data visualization", "django", "flask",
-        "fastapi", "html", "css", "tailwind", "bootstrap", "sass", "less", "redux", "graphql", "rest api"
-    }
-    found = {s for s in skills if s in text}
-    return [s.title() for s in sorted(found)]
-
 async def human_like_scroll(page, times=4):
     for _ in range(times):
         await page.evaluate("window.scrollBy(0, document.body.scrollHeight / 4)")
-        await asyncio.sleep(random.uniform(1.2, 2.5))
+        await asyncio.sleep(random.uniform(*Config.LINKEDIN_SCROLL_DELAY))
 
-async def scrape_job_detail(browser, job_url):
-    if not job_url or "linkedin.com" not in job_url:
+async def scrape_job_detail(pool, job_url):
+    base_host = urlparse(Config.LINKEDIN_BASE_URL).netloc
+    if not job_url or ("linkedin.com" not in job_url and urlparse(job_url).netloc != base_host):
         return "", "", []
 
     try:
-        page = await browser.new_page()
-        await page.goto(job_url, wait_until="networkidle", timeout=35000)
+        async with pool.page() as page:
+            await page.goto(job_url, wait_until="networkidle", timeout=35000)
 
-        try:
-            btn = await page.query_selector("button.show-more-less-html__button--more")
-            if btn and await btn.is_visible():
-                await btn.click()
-                await asyncio.sleep(2)
-        except:
-            pass
-
-        await human_like_scroll(page, times=3)
-
-        html = await page.content()
-        soup = BeautifulSoup(html, "html.parser")
-
-        desc = soup.select_one("div.show-more-less-html__markup, div.jobs-description__content")
-        if desc:
-            for bad in desc.select("button, script, style"):
-                bad.decompose()
-            text = desc.get_text(separator=" ", strip=True)
+            try:
+                btn = await page.query_selector("button.show-more-less-html__button--more")
+                if btn and await btn.is_visible():
+                    await btn.click()
+                    await asyncio.sleep(Config.LINKEDIN_SETTLE_DELAY / 2)
+            except:
+                pass
+
+            await human_like_scroll(page, times=3)
+
+            html = await page.content()
+
+        text = extract_description(html)
+        if text:
             salary = extract_salary(text)
             skills = extract_skills(text)
-            await page.close()
             return text, salary, skills
-
-        await page.close()
     except Exception as e:
         logger.warning(f"Detail failed: {e}")
 
     return "", "", []
 
-async def _scrape_linkedin_async(role: str, location: str = "", max_jobs: int = 10):
-    results = []
-    try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            
-            await page.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => false})")
-
-            search_url = f"https://www.linkedin.com/jobs/search/?keywords={quote(role)}&location={quote(location or 'Worldwide')}&f_TPR=r604800"
-            logger.info(f"LinkedIn URL: {search_url}")
-            
-            await page.goto(search_url, wait_until="networkidle")
-            await asyncio.sleep(4)
-            await human_like_scroll(page, times=4)
-
-            cards = await page.query_selector_all("ul.jobs-search__results-list > li")
-            logger.info(f"Found {len(cards)} LinkedIn cards")
-
-            jobs_data = []
-            for card in cards[:max_jobs]:
-                try:
-                    title_elem = await card.query_selector("h3")
-                    company_elem = await card.query_selector("h4")
-                    loc_elem = await card.query_selector("span.job-search-card__location")
-                    link_elem = await card.query_selector("a.base-card__full-link")
-                    
-                    if not (title_elem and company_elem and link_elem):
-                        continue
-
-                    title = await title_elem.inner_text()
-                    company = await company_elem.inner_text()
-                    location_text = await loc_elem.inner_text() if loc_elem else location
-                    link = await link_elem.get_attribute("href")
-                    link = urljoin("https://www.linkedin.com", link.split("?")[0])
-
-                    jobs_data.append({
-                        "title": title.strip(),
-                        "company": company.strip(),
-                        "location": location_text.strip(),
-                        "url": link,
-                        "source": "LinkedIn",
-                        "description": "",
-                        "salary": "",
-                        "skills_extracted": [],
-                        "match_score": 0
-                    })
-                except Exception as e:
+async def _enrich_linkedin_jobs(pool, jobs, limit=None, concurrency=None, timeout=None):
+    limit = Config.LINKEDIN_DETAIL_LIMIT if limit is None else limit
+    concurrency = concurrency or Config.LINKEDIN_DETAIL_CONCURRENCY
+    timeout = timeout or Config.LINKEDIN_DETAIL_TIMEOUT
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def enrich(job):
+        async with semaphore:
+            try:
+                desc, salary, skills = await asyncio.wait_for(scrape_job_detail(pool, job["url"]), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Detail timed out after {timeout}s: {job['url']}")
+                return
+        job["description"] = desc
+        job["salary"] = salary
+        job["skills_extracted"] = skills
+
+    await asyncio.gather(*(enrich(job) for job in jobs[:limit]))
+
+async def _scrape_linkedin_async(role: str, location: str = "", max_jobs: int = 10, detail_limit: int = None):
+    pool = get_browser_pool()
+    async with pool.page() as page:
+        search_url = f"{Config.LINKEDIN_BASE_URL}/jobs/search/?keywords={quote(role)}&location={quote(location or 'Worldwide')}&f_TPR=r604800"
+        logger.info(f"LinkedIn URL: {search_url}")
+        
+        await page.goto(search_url, wait_until="networkidle")
+        await asyncio.sleep(Config.LINKEDIN_SETTLE_DELAY)
+        await human_like_scroll(page, times=4)
+
+        cards = await page.query_selector_all("ul.jobs-search__results-list > li")
+        logger.info(f"Found {len(cards)} LinkedIn cards")
+
+        jobs_data = []
+        for card in cards[:max_jobs]:
+            try:
+                title_elem = await card.query_selector("h3")
+                company_elem = await card.query_selector("h4")
+                loc_elem = await card.query_selector("span.job-search-card__location")
+                link_elem = await card.query_selector("a.base-card__full-link")
+                
+                if not (title_elem and company_elem and link_elem):
                     continue
 
-            for job in jobs_data[:5]:
-                desc, salary, skills = await scrape_job_detail(browser, job["url"])
-                job["description"] = desc
-                job["salary"] = salary
-                job["skills_extracted"] = skills
+                title = await title_elem.inner_text()
+                company = await company_elem.inner_text()
+                location_text = await loc_elem.inner_text() if loc_elem else location
+                link = await link_elem.get_attribute("href")
+                link = urljoin(Config.LINKEDIN_BASE_URL, link.split("?")[0])
 
-            await browser.close()
-            results = jobs_data
-    except Exception as e:
-        logger.error(f"LinkedIn Scraper Failed: {e}")
-    
-    return results
+                jobs_data.append({
+                    "title": title.strip(),
+                    "company": company.strip(),
+                    "location": location_text.strip(),
+                    "url": link,
+                    "source": "LinkedIn",
+                    "description": "",
+                    "salary": "",
+                    "skills_extracted": [],
+                    "match_score": 0
+                })
+            except Exception as e:
+                continue
+
+    await _enrich_linkedin_jobs(pool, jobs_data, detail_limit)
+
+    return jobs_data
 
 async def _scrape_remoteok_async(role: str, max_jobs: int = 10):
-    results = []
+    await REMOTEOK_SNAPSHOT.ensure_fresh(await get_http_session())
+    return REMOTEOK_SNAPSHOT.search(role, max_jobs)
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold, reset_timeout):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+    @property
+    def is_open(self):
+        return self.opened_at is not None
+
+class ScrapeSource:
+    def __init__(self, name, fetch, timeout, max_concurrency, breaker):
+        self.name = name
+        self.fetch = fetch
+        self.timeout = timeout
+        self.breaker = breaker
+        self.max_concurrency = max_concurrency
+        self._slots = None
+        self._slots_loop = None
+
+    def _semaphore(self):
+        loop = asyncio.get_running_loop()
+        if self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+            self._slots_loop = loop
+        return self._slots
+
+    async def run(self, role, location, max_jobs):
+        if not self.breaker.allow():
+            logger.warning(f"{self.name}: circuit open, skipping")
+            return []
+
+        slots = self._semaphore()
+        try:
+            await asyncio.wait_for(slots.acquire(), self.timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"{self.name}: concurrency limit reached, skipping")
+            return []
+
+        try:
+            jobs = await asyncio.wait_for(self.fetch(role, location, max_jobs), self.timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"{self.name} Scraper timed out after {self.timeout}s")
+            self.breaker.record_failure()
+            return []
+        except Exception as e:
+            logger.error(f"{self.name} Scraper Failed: {e}")
+            self.breaker.record_failure()
+            return []
+        finally:
+            slots.release()
+
+        self.breaker.record_success()
+        return jobs
+
+SOURCES = {}
+
+def register_source(name, fetch, timeout=None, max_concurrency=2, failure_threshold=None, reset_timeout=None):
+    SOURCES[name] = ScrapeSource(
+        name,
+        fetch,
+        timeout or Config.SCRAPE_TIMEOUT,
+        max_concurrency,
+        CircuitBreaker(
+            failure_threshold or Config.SOURCE_FAILURE_THRESHOLD,
+            reset_timeout or Config.SOURCE_RESET_TIMEOUT
+        )
+    )
+    return SOURCES[name]
+
+register_source(
+    "LinkedIn",
+    _scrape_linkedin_async,
+    timeout=Config.LINKEDIN_TIMEOUT,
+    max_concurrency=Config.LINKEDIN_MAX_CONCURRENCY
+)
+register_source(
+    "RemoteOK",
+    lambda role, location, max_jobs: _scrape_remoteok_async(role, max_jobs),
+    max_concurrency=8
+)
+
+async def _gather_sources(role, location, max_jobs, deadline):
+    tasks = {
+        asyncio.ensure_future(source.run(role, location, max_jobs)): name
+        for name, source in SOURCES.items()
+    }
+    done, pending = await asyncio.wait(tasks, timeout=deadline)
+
+    for task in pending:
+        logger.warning(f"{tasks[task]}: missed the {deadline}s search deadline")
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    return [task.result() for task in done], not pending
+
+SCRAPE_CACHE = ScrapeCache(Config.SCRAPE_CACHE_DIR, Config.SCRAPE_CACHE_TTL, Config.SCRAPE_CACHE_STALE_TTL)
+
+def scrape_jobs(role: str, location: str = "", max_jobs: int = 20, use_cache: bool = True):
+    if not use_cache:
+        return _scrape_jobs_uncached(role, location, max_jobs)[0]
+
+    key = f"{normalize_query(role, location)}|{max_jobs}"
+    cached, is_stale = SCRAPE_CACHE.get(key)
+    if cached is not None:
+        logger.info(f"Cache hit ({'stale' if is_stale else 'fresh'}): {role} | {location}")
+        if is_stale:
+            SCRAPE_CACHE.refresh_in_background(key, lambda: _scrape_and_cache(key, role, location, max_jobs))
+        return cached
+
+    return _scrape_and_cache(key, role, location, max_jobs)
+
+def _scrape_and_cache(key, role, location, max_jobs):
+    jobs, complete = _scrape_jobs_uncached(role, location, max_jobs)
+    if jobs:
+        SCRAPE_CACHE.set(key, jobs, complete)
+    return jobs
+
+def _dedupe(jobs, index, collected):
+    unique = []
+    replaced = []
+    for job in dedupe_jobs(jobs):
+        duplicate_of = index.add_if_new(len(collected), job)
+        if duplicate_of is None:
+            collected.append(dict(job))
+            unique.append(job)
+        elif richness(job) > richness(collected[duplicate_of]):
+            replaced.append(collected[duplicate_of])
+            collected[duplicate_of] = dict(job)
+            unique.append(job)
+    return unique, replaced
+
+def iter_scrape_jobs(role: str, location: str = "", max_jobs: int = 20, deadline: float = None):
+    key = f"{normalize_query(role, location)}|{max_jobs}"
+    cached, is_stale = SCRAPE_CACHE.get(key)
+    if cached is not None:
+        logger.info(f"Cache hit ({'stale' if is_stale else 'fresh'}): {role} | {location}")
+        if is_stale:
+            SCRAPE_CACHE.refresh_in_background(key, lambda: _scrape_and_cache(key, role, location, max_jobs))
+        yield "Cache", cached, []
+        return
+
+    logger.info(f"Streaming scrape: {role} | {location}")
+    deadline = deadline or Config.SEARCH_DEADLINE
+
+    runtime = get_runtime()
+    futures = {
+        runtime.submit(source.run(role, location, max_jobs)): name
+        for name, source in SOURCES.items()
+    }
+    pending = set(futures)
+    seen = NearDuplicateIndex()
+    collected = []
+    ends_at = time.monotonic() + deadline
+
     try:
-        url = "https://remoteok.com/api"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    filtered = [j for j in data if isinstance(j, dict) and role.lower() in j.get('position', '').lower()]
-                    
-                    for item in filtered[:max_jobs]:
-                        desc = item.get('description', '')
-                        soup = BeautifulSoup(desc, "html.parser")
-                        clean_desc = soup.get_text(separator=" ", strip=True)
-                        
-                        results.append({
-                            "title": item.get('position'),
-                            "company": item.get('company'),
-                            "location": item.get('location', 'Remote'),
-                            "url": item.get('url'),
-                            "source": "RemoteOK",
-                            "description": clean_desc[:500] + "...",
-                            "salary": extract_salary(clean_desc),
-                            "skills_extracted": item.get('tags', []) + extract_skills(clean_desc),
-                            "match_score": 0
-                        })
-    except Exception as e:
-        logger.error(f"RemoteOK Scraper Failed: {e}")
-    
-    return results
+        while pending:
+            remaining = ends_at - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = wait_futures(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                batch, replaced = _dedupe(future.result(), seen, collected)
+                yield futures[future], batch, replaced
 
-def scrape_jobs(role: str, location: str = "", max_jobs: int = 20):
+        if collected:
+            SCRAPE_CACHE.set(key, collected, not pending)
+    finally:
+        for future in pending:
+            logger.warning(f"{futures[future]}: missed the {deadline}s search deadline")
+            future.cancel()
+
+def _scrape_jobs_uncached(role: str, location: str = "", max_jobs: int = 20, deadline: float = None):
     logger.info(f"Scraping: {role} | {location}")
-    
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    
-    tasks = [
-        _scrape_linkedin_async(role, location, max_jobs),
-        _scrape_remoteok_async(role, max_jobs)
-    ]
-    
-    results = loop.run_until_complete(asyncio.gather(*tasks))
-    loop.close()
-    
+    deadline = deadline or Config.SEARCH_DEADLINE
+
+    results, complete = get_runtime().run(_gather_sources(role, location, max_jobs, deadline))
+
     all_jobs = []
     for res in results:
         all_jobs.extend(res)
-        
-    seen = set()
-    unique = []
-    for j in all_jobs:
-        key = (j['title'], j['company'])
-        if key not in seen:
-            seen.add(key)
-            unique.append(j)
-    
-    logger.info(f"Total unique jobs: {len(unique)}")
-    return unique
\ No newline at end of file
+
+    unique = dedupe_jobs(all_jobs)
+
+    logger.info(f"Total unique jobs: {len(unique)}{'' if complete else ' (partial)'}")
+    return unique, complete
\ No newline at end of file
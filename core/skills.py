@@ -0,0 +1,111 @@
+import hashlib
+import json
+import re
+
+SKILLS_DB = {
+    "Python": ["python", "py", "python3", "python 3", "pandas", "numpy"],
+    "JavaScript": ["javascript", "js", "ecmascript", "node.js", "nodejs"],
+    "React": ["react", "react.js", "reactjs", "react native", "redux"],
+    "Node.js": ["node.js", "nodejs", "node"],
+    "Django": ["django", "django-rest", "drf"],
+    "Flask": ["flask"],
+    "FastAPI": ["fastapi", "fast api"],
+    "TypeScript": ["typescript", "ts", "type script"],
+    "Vue.js": ["vue", "vue.js", "vuejs", "vuetify"],
+    "Angular": ["angular", "angularjs"],
+
+    "AWS": ["aws", "amazon web services", "ec2", "s3", "lambda", "cloudformation", "ecs", "eks"],
+    "Docker": ["docker", "containers", "docker-compose"],
+    "Kubernetes": ["kubernetes", "k8s", "k8", "gke", "eks", "helm"],
+    "Terraform": ["terraform", "iac"],
+    "CI/CD": ["ci/cd", "ci cd", "jenkins", "gitlab ci", "github actions", "circleci"],
+
+    "Machine Learning": ["machine learning", "ml", "ai", "artificial intelligence"],
+    "Deep Learning": ["deep learning", "neural networks", "cnn", "rnn"],
+    "NLP": ["nlp", "natural language processing", "text mining", "bert", "gpt", "llm", "transformers", "hugging face"],
+    "Computer Vision": ["computer vision", "opencv", "yolo", "image processing"],
+    "TensorFlow": ["tensorflow", "tf", "keras"],
+    "PyTorch": ["pytorch", "torch"],
+    "Pandas": ["pandas", "pd"],
+    "NumPy": ["numpy", "np"],
+    "SQL": ["sql", "mysql", "postgresql", "postgres", "sqlite", "oracle", "mssql", "redshift"],
+
+    "Git": ["git", "github", "gitlab", "bitbucket"],
+    "Linux": ["linux", "ubuntu", "bash", "shell scripting"],
+    "Figma": ["figma", "ui/ux", "adobe xd"],
+    "Power BI": ["power bi", "powerbi"],
+    "Tableau": ["tableau"],
+    "Excel": ["excel", "vba", "pivot tables"],
+    "Agile": ["agile", "scrum", "kanban", "jira", "trello"],
+
+    "Azure": ["azure", "microsoft azure"],
+    "GCP": ["gcp", "google cloud", "google cloud platform"],
+    "Spark": ["spark", "pyspark", "apache spark"],
+    "Hadoop": ["hadoop", "hdfs", "hive"],
+    "Airflow": ["airflow", "apache airflow"],
+    "Kafka": ["kafka", "apache kafka"],
+    "Java": ["java", "spring boot"],
+    "Scala": ["scala"],
+    "R": ["r", "rstudio"],
+    "Scikit-learn": ["scikit-learn", "sklearn", "scikit learn"],
+    "Statistics": ["statistics", "statistical analysis"],
+    "Data Visualization": ["data visualization", "matplotlib", "seaborn", "plotly"],
+    "HTML": ["html", "html5"],
+    "CSS": ["css", "css3"],
+    "Tailwind": ["tailwind", "tailwindcss"],
+    "Bootstrap": ["bootstrap"],
+    "Sass": ["sass", "scss"],
+    "GraphQL": ["graphql"],
+    "REST API": ["rest api", "rest apis", "restful"],
+}
+
+# Short or everyday aliases that are fine in a CV but misfire in job ads
+# ("AI-driven products", "each node", "shipping containers").
+CV_ONLY_VARIANTS = {"ai", "ts", "py", "pd", "np", "tf", "k8", "node", "oracle", "lambda", "s3", "containers"}
+
+FLATTENED_SKILLS = {}
+for standard, variants in SKILLS_DB.items():
+    for v in variants:
+        FLATTENED_SKILLS[v.lower()] = standard
+
+JOB_SKILLS = {v: standard for v, standard in FLATTENED_SKILLS.items() if v not in CV_ONLY_VARIANTS}
+
+# Like \b, but "&" also joins words so "R&D" is not read as R.
+WORD_START = r"(?<![\w&])"
+WORD_END = r"(?![\w&])"
+
+
+class SkillMatcher:
+    def __init__(self, variants):
+        self.variants = dict(variants)
+        ordered = sorted(self.variants, key=len, reverse=True)
+        self.pattern = re.compile(WORD_START + "(?=(" + "|".join(re.escape(v) for v in ordered) + ")" + WORD_END + ")")
+
+        # A longer variant hides shorter ones that start at the same position
+        # ("gitlab ci" vs "gitlab"), so record everything each match implies.
+        self.implied = {}
+        for variant, standard in self.variants.items():
+            implied = {standard}
+            for other, other_standard in self.variants.items():
+                if other != variant and re.search(WORD_START + re.escape(other) + WORD_END, variant):
+                    implied.add(other_standard)
+            self.implied[variant] = frozenset(implied)
+
+    def find(self, text):
+        found = set()
+        if not text:
+            return found
+        for match in self.pattern.finditer(text.lower()):
+            found |= self.implied[match.group(1)]
+        return found
+
+
+SKILL_MATCHER = SkillMatcher(FLATTENED_SKILLS)
+JOB_SKILL_MATCHER = SkillMatcher(JOB_SKILLS)
+TAXONOMY_VERSION = hashlib.sha1(json.dumps(
+    [SKILLS_DB, sorted(CV_ONLY_VARIANTS), WORD_START, WORD_END], sort_keys=True
+).encode("utf-8")).hexdigest()[:12]
+
+
+def extract_skills(text):
+    return sorted(JOB_SKILL_MATCHER.find(text))
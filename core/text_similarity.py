@@ -0,0 +1,108 @@
+import math
+import re
+import zlib
+from collections import Counter
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+DIMENSIONS = 1 << 18
+SATURATION = 0.4
+TOKEN_RE = re.compile(r"[a-z][a-z0-9+#]+")
+STOP_WORDS = {
+    "and", "the", "for", "with", "you", "your", "our", "are", "will", "from", "that", "this", "have",
+    "has", "who", "all", "can", "not", "but", "into", "its", "their", "they", "them", "able", "work",
+    "working", "team", "role", "job", "years", "year", "experience", "strong", "good", "skills",
+}
+
+
+def _feature(token):
+    return zlib.crc32(token.encode("utf-8")) & (DIMENSIONS - 1)
+
+
+def vectorize(text):
+    counts = Counter(_feature(t) for t in TOKEN_RE.findall((text or "").lower()) if t not in STOP_WORDS)
+    if not counts:
+        return None
+    features = sorted(counts)
+    indices = np.asarray(features, dtype=np.uint32)
+    values = np.asarray([1 + math.log(counts[f]) for f in features], dtype=np.float32)
+    return indices, values
+
+
+def job_text(job):
+    return f"{job.get('title') or ''} {job.get('description') or ''}"
+
+
+def pack_vector(vector):
+    if vector is None:
+        return None
+    indices, values = vector
+    return indices.astype("<u4").tobytes() + values.astype("<f2").tobytes()
+
+
+def unpack_vector(blob):
+    if not blob:
+        return None
+    n = len(blob) // 6
+    indices = np.frombuffer(blob, dtype="<u4", count=n)
+    values = np.frombuffer(blob, dtype="<f2", count=n, offset=n * 4).astype(np.float32)
+    return indices, values
+
+
+class TermStatistics:
+    def __init__(self, df=None, doc_count=0, version=0):
+        self.df = df if df is not None else np.zeros(DIMENSIONS, dtype=np.int32)
+        self.doc_count = doc_count
+        self.version = version
+        self._idf = None
+
+    def add(self, vectors, sign=1):
+        for vector in vectors:
+            if vector is None:
+                continue
+            self.df[vector[0]] += sign
+            self.doc_count += sign
+        np.maximum(self.df, 0, out=self.df)
+        self.doc_count = max(self.doc_count, 0)
+        self._idf = None
+
+    def idf(self):
+        if self._idf is None:
+            self._idf = (np.log((1 + self.doc_count) / (1 + self.df)) + 1).astype(np.float32)
+        return self._idf
+
+
+def _weighted(vector, idf):
+    indices, values = vector
+    return indices, values * idf[indices]
+
+
+def similarity_batch(query, vectors, stats):
+    scores = np.full(len(vectors), np.nan)
+    if query is None:
+        return scores
+
+    idf = stats.idf()
+    q_indices, q_weights = _weighted(query, idf)
+    q_norm = np.sqrt(np.dot(q_weights, q_weights))
+    if not q_norm:
+        return scores
+    dense = np.zeros(DIMENSIONS, dtype=np.float32)
+    dense[q_indices] = q_weights / q_norm
+
+    rows = [i for i, v in enumerate(vectors) if v is not None]
+    if not rows:
+        return scores
+    indices = np.concatenate([vectors[i][0] for i in rows])
+    weights = np.concatenate([vectors[i][1] for i in rows]) * idf[indices]
+    owner = np.repeat(np.arange(len(rows)), [len(vectors[i][0]) for i in rows])
+
+    dots = np.bincount(owner, weights=weights * dense[indices], minlength=len(rows))
+    norms = np.sqrt(np.bincount(owner, weights=weights * weights, minlength=len(rows)))
+    cosine = np.divide(dots, norms, out=np.zeros(len(rows)), where=norms > 0)
+    scores[rows] = np.minimum(cosine / SATURATION, 1.0) * 100
+    return scores
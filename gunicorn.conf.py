@@ -0,0 +1,7 @@
+import multiprocessing
+
+bind = "127.0.0.1:5000"
+workers = multiprocessing.cpu_count()
+threads = 4
+worker_class = "gthread"
+timeout = 120